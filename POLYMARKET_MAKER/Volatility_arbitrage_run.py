@@ -19,6 +19,7 @@ import hmac
 import hashlib
 import json
 import inspect
+import logging
 from queue import Queue, Empty
 from dataclasses import dataclass
 from typing import Dict, Any, Tuple, List, Optional, Literal
@@ -32,6 +33,7 @@ from Volatility_arbitrage_strategy import (
     Action,
 )
 from maker_execution import (
+    logger as maker_logger,
     maker_buy_follow_bid,
     maker_sell_follow_ask_with_floor_wait,
 )
@@ -88,10 +90,45 @@ GAMMA_ROOT = os.getenv("POLY_GAMMA_ROOT", "https://gamma-api.polymarket.com")
 DATA_API_ROOT = os.getenv("POLY_DATA_API_ROOT", "https://data-api.polymarket.com")
 API_MIN_ORDER_SIZE = 5.0
 
+logger = logging.getLogger(__name__)
+
+
+def _ensure_console_logging() -> None:
+    """调用方未配置 logging 时，保持与 print 一致的控制台输出。
+
+    runner 与 maker_execution 的日志共用同一个同步写 stdout 的 handler，
+    与 runner 其余的 print 输出保持先后顺序。
+    """
+
+    if logger.handlers or logging.getLogger().handlers:
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    for target in (logger, maker_logger):
+        target.addHandler(handler)
+        target.setLevel(logging.INFO)
+        target.propagate = False
+
+
+# 签名按类固定，inspect.signature 较慢，故按 type(strategy) 缓存探测结果
+_TOTAL_POSITION_SUPPORT_CACHE: Dict[type, bool] = {}
+
 
 def _strategy_accepts_total_position(strategy: VolArbStrategy) -> bool:
     """Return True when ``strategy.on_buy_filled`` can consume ``total_position``."""
 
+    # 实例上单独挂了 on_buy_filled 时签名不再由类决定，跳过缓存
+    if "on_buy_filled" in getattr(strategy, "__dict__", ()):
+        return _probe_total_position_support(strategy)
+    cls = type(strategy)
+    supported = _TOTAL_POSITION_SUPPORT_CACHE.get(cls)
+    if supported is None:
+        supported = _probe_total_position_support(strategy)
+        _TOTAL_POSITION_SUPPORT_CACHE[cls] = supported
+    return supported
+
+
+def _probe_total_position_support(strategy: Any) -> bool:
     handler = getattr(strategy, "on_buy_filled", None)
     if handler is None or not callable(handler):
         return False
@@ -499,21 +536,31 @@ def _normalize_wallet_address(value: Any) -> Optional[str]:
     return None
 
 
+# 钱包地址候选：按优先级排列的 client 属性与环境变量（模块级常量，避免每次查询重建）
+_WALLET_ADDRESS_ATTRS = (
+    "funder",
+    "owner",
+    "address",
+    "wallet",
+    "wallet_address",
+    "walletAddress",
+    "default_address",
+    "defaultAddress",
+    "deposit_address",
+    "depositAddress",
+)
+_WALLET_ADDRESS_ATTR_SET = frozenset(_WALLET_ADDRESS_ATTRS)
+_WALLET_ADDRESS_ENV_KEYS = (
+    "POLY_DATA_ADDRESS",
+    "POLY_FUNDER",
+    "POLY_WALLET",
+    "POLY_ADDRESS",
+)
+
+
 def _resolve_wallet_address(client) -> Tuple[Optional[str], str]:
     if client is not None:
-        direct_attrs = (
-            "funder",
-            "owner",
-            "address",
-            "wallet",
-            "wallet_address",
-            "walletAddress",
-            "default_address",
-            "defaultAddress",
-            "deposit_address",
-            "depositAddress",
-        )
-        for attr in direct_attrs:
+        for attr in _WALLET_ADDRESS_ATTRS:
             try:
                 cand = getattr(client, attr, None)
             except Exception:
@@ -529,7 +576,7 @@ def _resolve_wallet_address(client) -> Tuple[Optional[str], str]:
         for attr in attrs:
             if "address" not in attr.lower():
                 continue
-            if attr in direct_attrs:
+            if attr in _WALLET_ADDRESS_ATTR_SET:
                 continue
             try:
                 cand = getattr(client, attr, None)
@@ -539,14 +586,11 @@ def _resolve_wallet_address(client) -> Tuple[Optional[str], str]:
             if address:
                 return address, f"client.{attr}"
 
-    env_candidates = (
-        "POLY_DATA_ADDRESS",
-        "POLY_FUNDER",
-        "POLY_WALLET",
-        "POLY_ADDRESS",
-    )
-    for env_name in env_candidates:
-        cand = os.getenv(env_name)
+    environ_get = os.environ.get
+    for env_name in _WALLET_ADDRESS_ENV_KEYS:
+        cand = environ_get(env_name)
+        if not cand:
+            continue
         address = _normalize_wallet_address(cand)
         if address:
             return address, f"env:{env_name}"
@@ -554,6 +598,13 @@ def _resolve_wallet_address(client) -> Tuple[Optional[str], str]:
     return None, "缺少地址，无法从数据接口拉取持仓。"
 
 
+# 数据接口的失败提示（前缀 + str(exc) 直接拼接）
+_DATA_API_REQUEST_FAILED = "数据接口请求失败："
+_DATA_API_NOT_FOUND = "数据接口返回 404（请确认使用 Proxy/Deposit 地址查询 user 参数）"
+_DATA_API_BAD_JSON = "数据接口响应解析失败"
+_DATA_API_MISSING_DATA = "数据接口返回格式异常，缺少 data 字段。"
+
+
 def _fetch_positions_from_data_api(client) -> Tuple[List[dict], bool, str]:
     address, origin_hint = _resolve_wallet_address(client)
 
@@ -577,24 +628,24 @@ def _fetch_positions_from_data_api(client) -> Tuple[List[dict], bool, str]:
         try:
             resp = requests.get(url, params=params, timeout=10)
         except requests.RequestException as exc:
-            return [], False, f"数据接口请求失败：{exc}"
+            return [], False, _DATA_API_REQUEST_FAILED + str(exc)
 
         if resp.status_code == 404:
-            return [], False, "数据接口返回 404（请确认使用 Proxy/Deposit 地址查询 user 参数）"
+            return [], False, _DATA_API_NOT_FOUND
 
         try:
             resp.raise_for_status()
         except requests.RequestException as exc:
-            return [], False, f"数据接口请求失败：{exc}"
+            return [], False, _DATA_API_REQUEST_FAILED + str(exc)
 
         try:
             payload = resp.json()
         except ValueError:
-            return [], False, "数据接口响应解析失败"
+            return [], False, _DATA_API_BAD_JSON
 
         positions = _extract_positions_from_data_api_response(payload)
         if positions is None:
-            return [], False, "数据接口返回格式异常，缺少 data 字段。"
+            return [], False, _DATA_API_MISSING_DATA
 
         collected.extend(positions)
         meta = payload.get("meta") if isinstance(payload, dict) else {}
@@ -1034,6 +1085,7 @@ def _place_sell_fok(client, token_id: str, price: float, size: float) -> Dict[st
 
 # ===== 主流程 =====
 def run_with_config(config: RunConfig) -> Dict[str, Any]:
+    _ensure_console_logging()
     client = _get_client()
     creds_check = _extract_api_creds(client)
     if not creds_check or not creds_check.get("key") or not creds_check.get("secret"):
@@ -1135,6 +1187,8 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
     action_queue: Queue[Action] = Queue()
     stop_event = threading.Event()
     sell_only_event = threading.Event()
+    # 盘口买一/卖一变化时置位，唤醒 maker 挂单循环提前检查
+    book_change_event = threading.Event()
     market_closed_detected = False
 
     slug_for_refresh = ""
@@ -1296,7 +1350,10 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
             if str(pc.get("asset_id")) != str(token_id):
                 continue
             bid, ask, last = _parse_price_change(pc)
+            prev = latest.get(token_id)
             latest[token_id] = {"price": last, "best_bid": bid, "best_ask": ask}
+            if prev is None or prev.get("best_bid") != bid or prev.get("best_ask") != ask:
+                book_change_event.set()
             action = strategy.on_tick(best_ask=ask, best_bid=bid, ts=ts)
             if action and action.action in (ActionType.BUY, ActionType.SELL):
                 action_queue.put(action)
@@ -1472,6 +1529,7 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
     if initial_pos > 0:
         position_size = initial_pos
         last_order_size = initial_pos
+    # 冷却/日志节流只关心时间间隔，使用单调时钟，避免系统时间跳变影响
     last_log: Optional[float] = None
     buy_cooldown_until: float = 0.0
     pending_buy: Optional[Action] = None
@@ -1523,6 +1581,7 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
                 min_order_size=API_MIN_ORDER_SIZE,
                 best_ask_fn=_latest_best_ask,
                 stop_check=stop_event.is_set,
+                change_event=book_change_event,
                 sell_mode=sell_mode,
             )
         except Exception as exc:
@@ -1575,7 +1634,8 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
     try:
         while not stop_event.is_set():
             now = time.time()
-            if pending_buy is not None and now >= buy_cooldown_until:
+            mono_now = time.monotonic()
+            if pending_buy is not None and mono_now >= buy_cooldown_until:
                 if sell_only_event.is_set():
                     print("[COUNTDOWN] 仍在仅卖出模式内，丢弃待执行的买入信号。")
                     strategy.on_reject("sell-only window active")
@@ -1585,7 +1645,7 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
                     action_queue.put(pending_buy)
                     pending_buy = None
 
-            if last_log is None or now - last_log >= 1.0:
+            if last_log is None or mono_now - last_log >= 1.0:
                 snap = latest.get(token_id) or {}
                 bid = float(snap.get("best_bid") or 0.0)
                 ask = float(snap.get("best_ask") or 0.0)
@@ -1630,7 +1690,7 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
                     extra_lines.append("    状态：倒计时仅卖出模式（禁止买入）")
                 for line in extra_lines:
                     print(line)
-                last_log = now
+                last_log = mono_now
 
             try:
                 action = action_queue.get(timeout=0.5)
@@ -1668,7 +1728,7 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
                 print("[COUNTDOWN] 当前处于倒计时仅卖出模式，忽略买入信号。")
                 strategy.on_reject("sell-only window active")
                 continue
-            now_for_buy = time.time()
+            now_for_buy = time.monotonic()
             if now_for_buy < buy_cooldown_until:
                 remaining = buy_cooldown_until - now_for_buy
                 print(
@@ -1715,13 +1775,14 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
                     min_order_size=API_MIN_ORDER_SIZE,
                     best_bid_fn=_latest_best_bid,
                     stop_check=stop_event.is_set,
+                    change_event=book_change_event,
                     progress_probe=_buy_progress_probe,
                     progress_probe_interval=60.0,
                 )
             except Exception as exc:
                 print(f"[ERR] 买入下单异常：{exc}")
                 strategy.on_reject(str(exc))
-                buy_cooldown_until = time.time() + short_buy_cooldown
+                buy_cooldown_until = time.monotonic() + short_buy_cooldown
                 continue
             print(f"[TRADE][BUY][MAKER] resp={buy_resp}")
             buy_status = str(buy_resp.get("status") or "").upper()
@@ -1730,6 +1791,7 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
             if filled_amt > 0:
                 fallback_price = float(avg_price if avg_price is not None else ref_price)
                 prior_position = float(position_size or 0.0)
+                # 卖出挂单的地板价依赖确认后的持仓均价，查询须在 POST-BUY 卖出之前同步完成
                 actual_avg_price: Optional[float] = None
                 actual_total_position: Optional[float] = None
                 origin_note = ""
@@ -1738,15 +1800,19 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
                         client, token_id
                     )
                 except Exception as exc:
-                    print(
-                        f"[WARN] 持仓均价查询异常：{exc}，沿用下单均价 {fallback_price:.4f}。"
+                    logger.warning(
+                        "[WARN] 持仓均价查询异常：%s，沿用下单均价 %.4f。",
+                        exc,
+                        fallback_price,
                     )
                 fill_px = fallback_price
                 if actual_avg_price is not None:
                     fill_px = actual_avg_price
                 elif origin_note:
-                    print(
-                        f"[WARN] 持仓均价查询失败({origin_note})，沿用下单均价 {fill_px:.4f}。"
+                    logger.warning(
+                        "[WARN] 持仓均价查询失败(%s)，沿用下单均价 %.4f。",
+                        origin_note,
+                        fill_px,
                     )
                 if actual_total_position is not None and actual_total_position > 0:
                     position_size = actual_total_position
@@ -1759,9 +1825,11 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
                         if actual_total_position is not None
                         else position_size
                     )
-                    origin_display = origin_note or "positions"
-                    print(
-                        f"[STATE] 持仓均价确认 -> origin={origin_display} avg={fill_px:.4f} size={display_size:.4f}"
+                    logger.info(
+                        "[STATE] 持仓均价确认 -> origin=%s avg=%.4f size=%.4f",
+                        origin_note or "positions",
+                        fill_px,
+                        display_size,
                     )
                 buy_filled_kwargs = {
                     "avg_price": fill_px,
@@ -1770,14 +1838,21 @@ def run_with_config(config: RunConfig) -> Dict[str, Any]:
                 if strategy_supports_total_position:
                     buy_filled_kwargs["total_position"] = position_size
                 strategy.on_buy_filled(**buy_filled_kwargs)
-                print(
-                    f"[STATE] 买入成交 -> status={buy_status or 'N/A'} price={fill_px:.4f} size={position_size:.4f}"
+                logger.info(
+                    "[STATE] 买入成交 -> status=%s price=%.4f size=%.4f",
+                    buy_status or "N/A",
+                    fill_px,
+                    position_size,
                 )
             else:
                 reason_text = str(buy_resp)
-                print(f"[WARN] 买入未成交(status={buy_status or 'N/A'})：{reason_text}")
+                logger.warning(
+                    "[WARN] 买入未成交(status=%s)：%s",
+                    buy_status or "N/A",
+                    reason_text,
+                )
                 strategy.on_reject(reason_text)
-            buy_cooldown_until = time.time() + short_buy_cooldown
+            buy_cooldown_until = time.monotonic() + short_buy_cooldown
 
             if filled_amt <= 0:
                 continue
@@ -7,11 +7,19 @@
 #   - 仅产出信号，不负责 size / 精度 / 下单执行。需上游成交回调推进状态。
 
 from __future__ import annotations
-from collections import deque
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from enum import Enum
+import math
 import time
-from typing import Optional, Dict, Any, Deque, Tuple
+from typing import Optional, Dict, Any, List, Tuple
+
+
+# 窗口内部统一使用整数纳秒做时间运算，避免逐笔浮点比较
+_NS_PER_SECOND = 1_000_000_000
+
+# 价格缓冲头部的过期数据累计到该数量且超过一半时才整体压缩
+_HISTORY_COMPACT_MIN = 256
 
 
 class ActionType(str, Enum):
@@ -84,18 +92,22 @@ class VolArbStrategy:
         self._last_signal: Optional[ActionType] = None
         self._position_size: Optional[float] = None
 
-        # 价格历史缓存：[(timestamp, price)]
-        self._price_history: Deque[Tuple[float, float]] = deque()
+        # 价格历史缓存：时间戳(ns)/价格并列存放，[_head:] 为窗口内有效数据
+        self._ts_buf: List[int] = []
+        self._px_buf: List[float] = []
+        self._head: int = 0
         self._history_window_seconds: float = self.cfg.drop_window_minutes * 60.0
+        self._history_window_ns: int = int(self._history_window_seconds * _NS_PER_SECOND)
 
-        # 跌幅统计
+        # 跌幅统计：逐笔只维护窗口高点，低点/最大跌幅等展示指标在 status() 时按需计算
         self._window_high_price: Optional[float] = None
-        self._window_low_price: Optional[float] = None
-        self._max_drop_ratio: Optional[float] = None
-        self._current_drop_ratio: Optional[float] = None
+        self._window_high_idx: int = -1
+        # 窗口内至少两笔且高点为正时才具备跌幅判定条件，由 _trim_history 维护
+        self._history_ready: bool = False
 
         # 最近行情记录
         self._last_tick_ts: Optional[float] = None
+        self._last_tick_ns: Optional[int] = None
         self._last_best_ask: Optional[float] = None
         self._last_best_bid: Optional[float] = None
 
@@ -111,6 +123,15 @@ class VolArbStrategy:
         # 记录跌幅阈值的初始值（用于动态递增的下限）
         self._initial_drop_pct: float = max(self.cfg.drop_pct, 0.0)
 
+        # 价域守门：未配置的一侧用 ±inf 哨兵，逐笔只需一组比较
+        self._min_price: float = -math.inf
+        self._max_price: float = math.inf
+        self._refresh_price_band()
+
+        # 逐笔信号判定实现：按静态配置与运行开关预先选定，开关变化时重新选择
+        self._signal_handler = self._signal_buy_sell
+        self._refresh_signal_handler()
+
     # ------------------------ 上游主调用：每笔行情快照 ------------------------
     def on_tick(
         self,
@@ -122,34 +143,63 @@ class VolArbStrategy:
         上游每次行情推送调用。返回 Action（BUY/SELL）或 None（无动作）。
         """
         if ts is None:
-            ts = time.time()
+            ts_ns = time.time_ns()
+            ts = ts_ns / _NS_PER_SECOND
+        else:
+            ts_ns = int(ts * _NS_PER_SECOND)
 
         # 价域守门（如不需要可在 cfg 设置为 None）
-        if self.cfg.min_price is not None and (best_ask < self.cfg.min_price or best_bid < self.cfg.min_price):
-            return None
-        if self.cfg.max_price is not None and (best_ask > self.cfg.max_price or best_bid > self.cfg.max_price):
+        lo, hi = self._min_price, self._max_price
+        if best_ask < lo or best_bid < lo or best_ask > hi or best_bid > hi:
             return None
 
         self._last_tick_ts = ts
+        self._last_tick_ns = ts_ns
         self._last_best_ask = best_ask
         self._last_best_bid = best_bid
 
-        price_for_drop = self._prepare_price_history(ts, (best_bid + best_ask) / 2)
-
-        if self._manual_stop:
-            return None
+        price_for_drop = self._prepare_price_history(ts_ns, (best_bid + best_ask) / 2)
+        return self._signal_handler(price_for_drop, best_ask, best_bid, ts)
 
-        if self._sell_only and self._state == "FLAT":
-            return None
+    # ------------------------ 逐笔信号判定（按开关特化） ------------------------
+    def _signal_none(
+        self, drop_price: float, best_ask: float, best_bid: float, ts: Optional[float]
+    ) -> Optional[Action]:
+        return None
 
+    def _signal_buy_only(
+        self, drop_price: float, best_ask: float, best_bid: float, ts: Optional[float]
+    ) -> Optional[Action]:
         if self._state == "FLAT":
-            return self._maybe_buy(price_for_drop, best_ask, ts)
+            return self._maybe_buy(drop_price, best_ask, ts)
+        return None
 
-        elif self._state == "LONG":
+    def _signal_sell_only(
+        self, drop_price: float, best_ask: float, best_bid: float, ts: Optional[float]
+    ) -> Optional[Action]:
+        if self._state == "LONG":
             return self._maybe_sell(best_bid, ts)
+        return None
 
+    def _signal_buy_sell(
+        self, drop_price: float, best_ask: float, best_bid: float, ts: Optional[float]
+    ) -> Optional[Action]:
+        if self._state == "FLAT":
+            return self._maybe_buy(drop_price, best_ask, ts)
+        if self._state == "LONG":
+            return self._maybe_sell(best_bid, ts)
         return None
 
+    def _refresh_signal_handler(self) -> None:
+        sells_enabled = not self.cfg.disable_sell_signals
+        if self._manual_stop:
+            handler = self._signal_none
+        elif self._sell_only:
+            handler = self._signal_sell_only if sells_enabled else self._signal_none
+        else:
+            handler = self._signal_buy_sell if sells_enabled else self._signal_buy_only
+        self._signal_handler = handler
+
     # ------------------------ 买入/卖出触发判定 ------------------------
     def _maybe_buy(self, drop_price: float, best_ask: float, ts: Optional[float]) -> Optional[Action]:
         if self._awaiting == ActionType.BUY and self.cfg.disable_duplicate_signal:
@@ -159,7 +209,7 @@ class VolArbStrategy:
         drop_ratio: Optional[float] = None
         window_high: Optional[float] = self._window_high_price
 
-        if len(self._price_history) > 1 and window_high is not None and window_high > 0:
+        if self._history_ready:
             drop_ratio = (window_high - drop_price) / window_high
             drop_trigger = drop_ratio >= self.cfg.drop_pct
 
@@ -173,7 +223,7 @@ class VolArbStrategy:
 
         reasons = []
         extra = {
-            "history_points": len(self._price_history),
+            "history_points": self._history_len(),
             "drop_window_minutes": self.cfg.drop_window_minutes,
             "drop_triggered": drop_trigger,
             "threshold_triggered": threshold_trigger,
@@ -209,9 +259,6 @@ class VolArbStrategy:
         return act
 
     def _maybe_sell(self, best_bid: float, ts: Optional[float]) -> Optional[Action]:
-        if getattr(self.cfg, "disable_sell_signals", False):
-            return None
-
         if self._entry_price is None:
             return None  # 防守式检查
 
@@ -245,65 +292,82 @@ class VolArbStrategy:
             return act
         return None
 
-    def _prepare_price_history(self, ts: float, price: float) -> float:
-        self._price_history.append((ts, price))
-        self._trim_history(ts)
+    def _prepare_price_history(self, ts_ns: int, price: float) -> float:
+        ts_buf = self._ts_buf
+        # 二分裁剪要求时间戳单调：乱序到达的行情按上一笔时间入列
+        if ts_buf and ts_ns < ts_buf[-1]:
+            ts_ns = ts_buf[-1]
+        ts_buf.append(ts_ns)
+        self._px_buf.append(price)
+        high = self._window_high_price
+        if high is None or price >= high:
+            self._window_high_price = price
+            self._window_high_idx = len(ts_buf) - 1
+        self._trim_history(ts_ns)
         return price
 
-    def _trim_history(self, ts: float) -> None:
-        window = self._history_window_seconds
-        while self._price_history and ts - self._price_history[0][0] > window:
-            self._price_history.popleft()
-        while self._price_history and len(self._price_history) > self.cfg.max_history_points:
-            self._price_history.popleft()
-        if self._price_history:
+    def _history_len(self) -> int:
+        return len(self._ts_buf) - self._head
+
+    def _trim_history(self, ts_ns: int) -> None:
+        # 时间戳单调递增，二分定位新的窗口起点，一次性推进 head；
+        # 只有窗口高点被淘汰时才需要重扫
+        ts_buf = self._ts_buf
+        size = len(ts_buf)
+        head = bisect_left(ts_buf, ts_ns - self._history_window_ns, self._head, size)
+        head = max(head, size - self.cfg.max_history_points)
+        if head >= size:
+            self._clear_history()
+            return
+        self._head = head
+        if self._window_high_price is None or self._window_high_idx < head:
             self._update_drop_metrics()
-        else:
-            self._reset_drop_metrics()
+        if head >= _HISTORY_COMPACT_MIN and head * 2 >= size:
+            del ts_buf[:head]
+            del self._px_buf[:head]
+            self._window_high_idx -= head
+            self._head = 0
+        high = self._window_high_price
+        self._history_ready = high is not None and high > 0 and size - head > 1
+
+    def _clear_history(self) -> None:
+        self._ts_buf.clear()
+        self._px_buf.clear()
+        self._head = 0
+        self._history_ready = False
+        self._reset_drop_metrics()
 
     def _reset_drop_metrics(self) -> None:
         self._window_high_price = None
-        self._window_low_price = None
-        self._max_drop_ratio = None
-        self._current_drop_ratio = None
+        self._window_high_idx = -1
 
     def _update_drop_metrics(self) -> None:
-        if not self._price_history:
+        head = self._head
+        if head >= len(self._px_buf):
             self._reset_drop_metrics()
             return
 
-        high_price: Optional[float] = None
-        low_price: Optional[float] = None
-        for _, px in self._price_history:
-            if high_price is None or px > high_price:
-                high_price = px
-            if low_price is None or px < low_price:
-                low_price = px
-
-        if high_price is None:
-            self._reset_drop_metrics()
-            return
+        high_price = max(self._px_buf[head:])
+        self._window_high_price = high_price
+        self._window_high_idx = self._px_buf.index(high_price, head)
 
-        current_price = self._price_history[-1][1]
+    def _compute_low_and_max_drop(
+        self,
+    ) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """按当前窗口计算 (低点, 最大跌幅, 当前跌幅)，仅供 status() 展示使用。"""
+        high_price = self._window_high_price
+        if self._history_len() <= 0 or high_price is None:
+            return None, None, None
+
+        low_price = min(self._px_buf[self._head:])
+        current_price = self._px_buf[-1]
         if high_price > 0:
-            max_drop = (
-                (high_price - low_price) / high_price
-                if low_price is not None and low_price <= high_price
-                else 0.0
-            )
-            current_drop = (
-                (high_price - current_price) / high_price
-                if current_price is not None
-                else None
-            )
+            max_drop = (high_price - low_price) / high_price if low_price <= high_price else 0.0
+            current_drop = (high_price - current_price) / high_price
         else:
             max_drop = 0.0
-            current_drop = 0.0 if current_price is not None else None
-
-        self._window_high_price = high_price
-        self._window_low_price = low_price
-        self._max_drop_ratio = max_drop
-        self._current_drop_ratio = current_drop
+            current_drop = 0.0
+        return low_price, max_drop, current_drop
 
     # ------------------------ 上游回调：成交/被拒 ------------------------
     def on_buy_filled(
@@ -449,21 +513,25 @@ class VolArbStrategy:
         self._manual_stop = True
         self._manual_stop_reason = reason
         self._awaiting = None
+        self._refresh_signal_handler()
 
     def resume(self) -> None:
         """恢复策略运行。"""
         self._manual_stop = False
         self._manual_stop_reason = None
+        self._refresh_signal_handler()
 
     def enable_sell_only(self, reason: Optional[str] = None) -> None:
         """仅允许卖出，不再触发买入信号。"""
         self._sell_only = True
         self._sell_only_reason = reason
+        self._refresh_signal_handler()
 
     def disable_sell_only(self) -> None:
         """恢复买入能力。"""
         self._sell_only = False
         self._sell_only_reason = None
+        self._refresh_signal_handler()
 
     # ------------------------ 实用方法 ------------------------
     def update_params(
@@ -490,15 +558,16 @@ class VolArbStrategy:
         if drop_window_minutes is not None:
             self.cfg.drop_window_minutes = drop_window_minutes
             self._history_window_seconds = drop_window_minutes * 60.0
-            if self._last_tick_ts is not None:
-                self._trim_history(self._last_tick_ts)
+            self._history_window_ns = int(self._history_window_seconds * _NS_PER_SECOND)
+            if self._last_tick_ns is not None:
+                self._trim_history(self._last_tick_ns)
         if drop_pct is not None:
             self.cfg.drop_pct = drop_pct
             self._initial_drop_pct = max(drop_pct, 0.0)
         if max_history_points is not None:
             self.cfg.max_history_points = max(1, int(max_history_points))
-            if self._last_tick_ts is not None:
-                self._trim_history(self._last_tick_ts)
+            if self._last_tick_ns is not None:
+                self._trim_history(self._last_tick_ns)
         if enable_incremental_drop_pct is not None:
             self.cfg.enable_incremental_drop_pct = bool(enable_incremental_drop_pct)
         if incremental_drop_pct_step is not None:
@@ -513,6 +582,7 @@ class VolArbStrategy:
         return self._entry_price * (1.0 + profit_pct)
 
     def status(self) -> Dict[str, Any]:
+        window_low, max_drop_ratio, current_drop_ratio = self._compute_low_and_max_drop()
         return {
             "state": self._state,
             "awaiting": self._awaiting,
@@ -522,7 +592,7 @@ class VolArbStrategy:
             "last_signal": self._last_signal,
             "last_buy_price": self._last_buy_price,
             "last_sell_price": self._last_sell_price,
-            "price_history_len": len(self._price_history),
+            "price_history_len": self._history_len(),
             "manual_stop": self._manual_stop,
             "manual_stop_reason": self._manual_stop_reason,
             "sell_only": self._sell_only,
@@ -535,9 +605,9 @@ class VolArbStrategy:
             },
             "drop_stats": {
                 "window_high": self._window_high_price,
-                "window_low": self._window_low_price,
-                "max_drop_ratio": self._max_drop_ratio,
-                "current_drop_ratio": self._current_drop_ratio,
+                "window_low": window_low,
+                "max_drop_ratio": max_drop_ratio,
+                "current_drop_ratio": current_drop_ratio,
                 "window_seconds": self._history_window_seconds,
             },
             "config": {
@@ -557,6 +627,12 @@ class VolArbStrategy:
         }
 
     # ------------------------ 内部辅助 ------------------------
+    def _refresh_price_band(self) -> None:
+        min_price = self.cfg.min_price
+        max_price = self.cfg.max_price
+        self._min_price = min_price if min_price is not None else -math.inf
+        self._max_price = max_price if max_price is not None else math.inf
+
     def _maybe_increment_drop_pct(self) -> None:
         if not getattr(self.cfg, "enable_incremental_drop_pct", False):
             return
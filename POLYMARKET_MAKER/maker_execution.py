@@ -19,245 +19,521 @@ script:
 Both helpers favour websocket snapshots supplied by the caller via
 ``best_bid_fn`` / ``best_ask_fn``. When these callables are absent or return
 ``None`` the helpers fall back to best-effort REST lookups using the provided
-client.
+client. Callers that also pass ``change_event`` (set by the websocket layer on
+every top-of-book update) let the loop re-check the websocket price as soon as
+the book moves; the order-status lookup is only brought forward when that price
+crosses the re-quote threshold, and never more often than once per
+``_MIN_STATUS_POLL_SEC``. Likewise ``order_status_fn``
+lets a pushed order-status feed (e.g. the authenticated user channel) answer the
+per-poll status lookup; the REST ``get_order_status`` call is only made when the
+feed has nothing for the working order.
 
 The functions return lightweight dictionaries that summarise order history and
 fill statistics so that the strategy layer can update its internal state.
 """
 from __future__ import annotations
 
+import logging
 import math
+import threading
 import time
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, reduce
 from collections.abc import Callable, Iterable, Mapping
 from typing import Any, Dict, List, Optional, Tuple
 
 from trading.execution import ClobPolymarketAPI
 
 
+logger = logging.getLogger(__name__)
+# 库模块不替调用方决定日志去向与级别；控制台输出由 runner 的 _ensure_console_logging 配置
+logger.addHandler(logging.NullHandler())
+
 BUY_PRICE_DP = 2
 BUY_SIZE_DP = 4
 SELL_PRICE_DP = 4
 SELL_SIZE_DP = 2
+_BUY_TICK = 10 ** (-BUY_PRICE_DP)
+_SELL_TICK = 10 ** (-SELL_PRICE_DP)
 _MIN_FILL_EPS = 1e-9
 DEFAULT_MIN_ORDER_SIZE = 5.0
 
+# 订单状态（大写）分类：成交完结 / 撤单或失效
+_FINAL_STATES = frozenset({"FILLED", "MATCHED", "COMPLETED", "EXECUTED"})
+_CANCEL_STATES = frozenset({"CANCELLED", "CANCELED", "REJECTED", "EXPIRED"})
+# 接口常见的大写状态；命中时直接复用，省去每轮轮询的 upper() 拷贝
+_UPPER_STATES = _FINAL_STATES | _CANCEL_STATES | frozenset({"OPEN", "LIVE", "UNKNOWN"})
+
+# 10 ** dp 查表（dp 仅取 0~9）。保留除法而非乘倒数，避免 0.57 变成 0.5700000000000001
+_POW10: Tuple[float, ...] = tuple(10.0 ** dp for dp in range(10))
+
 
 def _round_up_to_dp(value: float, dp: int) -> float:
-    factor = 10 ** dp
+    factor = _POW10[dp]
     return math.ceil(value * factor - 1e-12) / factor
 
 
+# 卖出价取整的输入集中在少数盘口档位上，命中缓存即可省去乘除与取整
+@lru_cache(maxsize=4096)
 def _round_down_to_dp(value: float, dp: int) -> float:
-    factor = 10 ** dp
+    factor = _POW10[dp]
     return math.floor(value * factor + 1e-12) / factor
 
 
-def _ceil_to_dp(value: float, dp: int) -> float:
-    factor = 10 ** dp
+# 数量精度固定，调用方直接传入预先算好的倍数，省去每次查表
+_BUY_SIZE_FACTOR = _POW10[BUY_SIZE_DP]
+_SELL_SIZE_FACTOR = _POW10[SELL_SIZE_DP]
+
+
+def _ceil_to_dp(value: float, factor: float) -> float:
     return math.ceil(value * factor - 1e-12) / factor
 
 
-def _floor_to_dp(value: float, dp: int) -> float:
-    factor = 10 ** dp
+def _floor_to_dp(value: float, factor: float) -> float:
     return math.floor(value * factor + 1e-12) / factor
 
 
+@lru_cache(maxsize=1024)
+def _parse_float_str(value: str) -> Optional[float]:
+    # 盘口价格档位在轮询间高度重复，字符串解析结果按原文缓存
+    raw = value.strip()
+    if not raw:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
 def _coerce_float(value: Any) -> Optional[float]:
     if value is None:
         return None
     if isinstance(value, (int, float)) and not isinstance(value, bool):
         return float(value)
     if isinstance(value, str):
-        raw = value.strip()
-        if not raw:
-            return None
-        try:
-            return float(raw)
-        except ValueError:
-            return None
+        return _parse_float_str(value)
     return None
 
 
+_PRIMARY_BID_KEYS = (
+    "best_bid",
+    "bestBid",
+    "bid",
+    "highestBid",
+    "bestBidPrice",
+    "bidPrice",
+    "buy",
+)
+_PRIMARY_ASK_KEYS = (
+    "best_ask",
+    "bestAsk",
+    "ask",
+    "offer",
+    "best_offer",
+    "bestOffer",
+    "lowestAsk",
+    "sell",
+)
+_LADDER_BID_KEYS = ("bids", "bid_levels", "buy_orders", "buyOrders")
+_LADDER_ASK_KEYS = ("asks", "ask_levels", "sell_orders", "sellOrders", "offers")
+_TEXT_TYPES = (str, bytes, bytearray)
+# 防御自引用结构：超过该嵌套深度的节点不再展开
+_MAX_PRICE_SEARCH_DEPTH = 64
+
+
+def _price_children(
+    node: Any, primary_keys: Tuple[str, ...], ladder_keys: Tuple[str, ...]
+) -> Iterable[Tuple[Any, bool]]:
+    """按优先级惰性产出 ``(子节点, 是否为盘口档位)``。"""
+
+    if isinstance(node, Mapping):
+        for key in primary_keys:
+            if key in node:
+                yield node[key], False
+        for key in ladder_keys:
+            if key in node:
+                ladder = node[key]
+                if isinstance(ladder, Iterable) and not isinstance(ladder, _TEXT_TYPES):
+                    for entry in ladder:
+                        yield entry, True
+        for value in node.values():
+            yield value, False
+    elif isinstance(node, Iterable) and not isinstance(node, _TEXT_TYPES):
+        for item in node:
+            yield item, False
+
+
 def _extract_best_price(payload: Any, side: str) -> Optional[float]:
     numeric = _coerce_float(payload)
     if numeric is not None:
         return numeric
 
-    if isinstance(payload, Mapping):
-        primary_keys = {
-            "bid": (
-                "best_bid",
-                "bestBid",
-                "bid",
-                "highestBid",
-                "bestBidPrice",
-                "bidPrice",
-                "buy",
-            ),
-            "ask": (
-                "best_ask",
-                "bestAsk",
-                "ask",
-                "offer",
-                "best_offer",
-                "bestOffer",
-                "lowestAsk",
-                "sell",
-            ),
-        }[side]
-        for key in primary_keys:
-            if key in payload:
-                extracted = _extract_best_price(payload[key], side)
-                if extracted is not None:
-                    return extracted
-
-        ladder_keys = {
-            "bid": ("bids", "bid_levels", "buy_orders", "buyOrders"),
-            "ask": ("asks", "ask_levels", "sell_orders", "sellOrders", "offers"),
-        }[side]
-        for key in ladder_keys:
-            if key in payload:
-                ladder = payload[key]
-                if isinstance(ladder, Iterable) and not isinstance(ladder, (str, bytes, bytearray)):
-                    for entry in ladder:
-                        if isinstance(entry, Mapping) and "price" in entry:
-                            candidate = _coerce_float(entry.get("price"))
-                            if candidate is not None:
-                                return candidate
-                        extracted = _extract_best_price(entry, side)
-                        if extracted is not None:
-                            return extracted
-
-        for value in payload.values():
-            extracted = _extract_best_price(value, side)
-            if extracted is not None:
-                return extracted
-        return None
+    # 常见形态 ``[price, ...]`` / ``[[price, size], ...]``：直接取首档，结果与通用遍历一致
+    if isinstance(payload, (list, tuple)) and payload:
+        head = payload[0]
+        numeric = _coerce_float(head)
+        if numeric is not None:
+            return numeric
+        if isinstance(head, (list, tuple)) and head:
+            numeric = _coerce_float(head[0])
+            if numeric is not None:
+                return numeric
+
+    if side == "bid":
+        primary_keys, ladder_keys = _PRIMARY_BID_KEYS, _LADDER_BID_KEYS
+    else:
+        primary_keys, ladder_keys = _PRIMARY_ASK_KEYS, _LADDER_ASK_KEYS
+
+    # 显式栈做深度优先遍历，访问顺序与原递归实现一致
+    stack: List[Tuple[Iterable[Tuple[Any, bool]], int]] = [
+        (iter(_price_children(payload, primary_keys, ladder_keys)), 1)
+    ]
+    while stack:
+        children, depth = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            continue
+        node, is_ladder_entry = child
+        if is_ladder_entry and isinstance(node, Mapping) and "price" in node:
+            candidate = _coerce_float(node.get("price"))
+            if candidate is not None:
+                return candidate
+        numeric = _coerce_float(node)
+        if numeric is not None:
+            return numeric
+        if depth < _MAX_PRICE_SEARCH_DEPTH and (
+            isinstance(node, Mapping)
+            or (isinstance(node, Iterable) and not isinstance(node, _TEXT_TYPES))
+        ):
+            stack.append((iter(_price_children(node, primary_keys, ladder_keys)), depth + 1))
+    return None
 
-    if isinstance(payload, Iterable) and not isinstance(payload, (str, bytes, bytearray)):
-        for item in payload:
-            extracted = _extract_best_price(item, side)
-            if extracted is not None:
-                return extracted
-        return None
 
+_BEST_PRICE_METHODS: Tuple[Tuple[str, str], ...] = (
+    ("get_market_orderbook", "market"),
+    ("get_market_orderbook", "token_id"),
+    ("get_market_orderbook", "market_id"),
+    ("get_order_book", "market"),
+    ("get_order_book", "token_id"),
+    ("get_orderbook", "market"),
+    ("get_orderbook", "token_id"),
+    ("get_market", "market"),
+    ("get_market", "token_id"),
+    ("get_market_data", "market"),
+    ("get_market_data", "token_id"),
+    ("get_ticker", "market"),
+    ("get_ticker", "token_id"),
+)
+
+# (type(client), side) -> 上次成功取到价格的 (方法名, 参数名)
+_BEST_PRICE_METHOD_CACHE: Dict[Tuple[type, str], Tuple[str, str]] = {}
+
+
+def _call_best_price_method(
+    fn: Callable[..., Any], kwarg: str, token_id: str, side: str
+) -> Optional[float]:
+    resp = fn(**{kwarg: token_id})
+    payload = resp
+    if isinstance(resp, tuple) and len(resp) == 2:
+        payload = resp[1]
+    if isinstance(payload, Mapping) and "data" in payload and "status" in payload:
+        payload = payload.get("data")
+
+    best = _extract_best_price(payload, side)
+    if best is not None:
+        return float(best)
     return None
 
 
 def _fetch_best_price(client: Any, token_id: str, side: str) -> Optional[float]:
-    method_candidates = (
-        ("get_market_orderbook", {"market": token_id}),
-        ("get_market_orderbook", {"token_id": token_id}),
-        ("get_market_orderbook", {"market_id": token_id}),
-        ("get_order_book", {"market": token_id}),
-        ("get_order_book", {"token_id": token_id}),
-        ("get_orderbook", {"market": token_id}),
-        ("get_orderbook", {"token_id": token_id}),
-        ("get_market", {"market": token_id}),
-        ("get_market", {"token_id": token_id}),
-        ("get_market_data", {"market": token_id}),
-        ("get_market_data", {"token_id": token_id}),
-        ("get_ticker", {"market": token_id}),
-        ("get_ticker", {"token_id": token_id}),
-    )
+    cache_key = (type(client), side)
+    cached = _BEST_PRICE_METHOD_CACHE.get(cache_key)
+    if cached is not None:
+        name, kwarg = cached
+        fn = getattr(client, name, None)
+        if not callable(fn):
+            _BEST_PRICE_METHOD_CACHE.pop(cache_key, None)
+        else:
+            try:
+                best = _call_best_price_method(fn, kwarg, token_id, side)
+            except (AttributeError, TypeError):
+                _BEST_PRICE_METHOD_CACHE.pop(cache_key, None)
+            except Exception:
+                pass
+            else:
+                if best is not None:
+                    return best
 
-    for name, kwargs in method_candidates:
+    for candidate in _BEST_PRICE_METHODS:
+        if candidate == cached:
+            continue
+        name, kwarg = candidate
         fn = getattr(client, name, None)
         if not callable(fn):
             continue
         try:
-            resp = fn(**kwargs)
-        except TypeError:
-            continue
+            best = _call_best_price_method(fn, kwarg, token_id, side)
         except Exception:
             continue
+        if best is not None:
+            _BEST_PRICE_METHOD_CACHE[cache_key] = candidate
+            return best
+    return None
 
-        payload = resp
-        if isinstance(resp, tuple) and len(resp) == 2:
-            payload = resp[1]
-        if isinstance(payload, Mapping) and {"data", "status"} <= set(payload.keys()):
-            payload = payload.get("data")
 
-        best = _extract_best_price(payload, side)
-        if best is not None:
-            return float(best)
+def _snapshot_price(price_fn: Optional[Callable[[], Optional[float]]]) -> Optional[float]:
+    if price_fn is None:
+        return None
+    try:
+        val = price_fn()
+    except Exception:
+        val = None
+    if val is not None and val > 0:
+        return float(val)
     return None
 
 
 def _best_bid(client: Any, token_id: str, best_bid_fn: Optional[Callable[[], Optional[float]]]) -> Optional[float]:
-    if best_bid_fn is not None:
-        try:
-            val = best_bid_fn()
-        except Exception:
-            val = None
-        if val is not None and val > 0:
-            return float(val)
+    val = _snapshot_price(best_bid_fn)
+    if val is not None:
+        return val
     return _fetch_best_price(client, token_id, "bid")
 
 
 def _best_ask(client: Any, token_id: str, best_ask_fn: Optional[Callable[[], Optional[float]]]) -> Optional[float]:
-    if best_ask_fn is not None:
+    val = _snapshot_price(best_ask_fn)
+    if val is not None:
+        return val
+    return _fetch_best_price(client, token_id, "ask")
+
+
+_POLL_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_POLL_EXECUTOR_LOCK = threading.Lock()
+
+
+def _poll_executor() -> ThreadPoolExecutor:
+    global _POLL_EXECUTOR
+    if _POLL_EXECUTOR is None:
+        with _POLL_EXECUTOR_LOCK:
+            if _POLL_EXECUTOR is None:
+                _POLL_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="maker-poll")
+    return _POLL_EXECUTOR
+
+
+def _poll_status_and_price(
+    adapter: Any,
+    order_id: str,
+    client: Any,
+    token_id: str,
+    side: str,
+    price_fn: Optional[Callable[[], Optional[float]]],
+    status_fn: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
+) -> Tuple[Optional[Dict[str, Any]], Optional[Exception], Optional[float]]:
+    """查询订单状态并取盘口价，返回 (状态, 状态查询异常, 盘口价)。
+
+    websocket 快照可用时直接使用；否则 REST 盘口查询放到后台线程，与订单状态
+    查询并发执行，单次轮询的等待时间取两者较大值而非相加。订单状态同理：
+    ``status_fn`` 给出推送来的状态时不再走 REST，推送断开或尚无数据时回退查询。
+    """
+
+    price = _snapshot_price(price_fn)
+    price_future: Optional[Future] = None
+    if price is None:
+        price_future = _poll_executor().submit(_fetch_best_price, client, token_id, side)
+
+    status_payload: Optional[Dict[str, Any]] = None
+    status_error: Optional[Exception] = None
+    if status_fn is not None:
         try:
-            val = best_ask_fn()
+            status_payload = status_fn(order_id)
         except Exception:
-            val = None
-        if val is not None and val > 0:
-            return float(val)
-    return _fetch_best_price(client, token_id, "ask")
+            status_payload = None
+    if status_payload is None:
+        try:
+            status_payload = adapter.get_order_status(order_id)
+        except Exception as exc:
+            status_error = exc
+
+    if price_future is not None:
+        try:
+            price = price_future.result()
+        except Exception:
+            price = None
+    return status_payload, status_error, price
+
+
+_CANCEL_METHOD_NAMES = (
+    "cancel_order",
+    "cancelOrder",
+    "cancel",
+    "cancel_orders",
+    "cancelOrders",
+    "delete_order",
+    "deleteOrder",
+    "cancel_limit_order",
+    "cancelLimitOrder",
+    "cancel_open_order",
+    "cancelOpenOrder",
+)
+
+# type(client) -> (嵌套属性路径, 方法名)。只缓存路径而非绑定方法，不延长 client 生命周期。
+_CANCEL_METHOD_CACHE: Dict[type, Tuple[Tuple[str, ...], str]] = {}
+
+
+def _invoke_cancel(method: Callable[..., Any], order_id: str) -> bool:
+    try:
+        method(order_id)
+        return True
+    except TypeError:
+        try:
+            method(id=order_id)
+            return True
+        except Exception:
+            return False
+    except Exception:
+        return False
 
 
 def _cancel_order(client: Any, order_id: Optional[str]) -> bool:
     if not order_id:
         return False
-    method_names = (
-        "cancel_order",
-        "cancelOrder",
-        "cancel",
-        "cancel_orders",
-        "cancelOrders",
-        "delete_order",
-        "deleteOrder",
-        "cancel_limit_order",
-        "cancelLimitOrder",
-        "cancel_open_order",
-        "cancelOpenOrder",
-    )
 
-    targets: deque[Any] = deque([client])
+    client_type = type(client)
+    cached = _CANCEL_METHOD_CACHE.get(client_type)
+    if cached is not None:
+        path, name = cached
+        try:
+            method = getattr(reduce(getattr, path, client), name)
+        except AttributeError:
+            method = None
+        if callable(method) and _invoke_cancel(method, order_id):
+            return True
+        _CANCEL_METHOD_CACHE.pop(client_type, None)
+
+    targets: deque[Tuple[Any, Tuple[str, ...]]] = deque([(client, ())])
     visited: set[int] = set()
     while targets:
-        obj = targets.popleft()
+        obj, path = targets.popleft()
         if obj is None:
             continue
         obj_id = id(obj)
         if obj_id in visited:
             continue
         visited.add(obj_id)
-        for name in method_names:
+        for name in _CANCEL_METHOD_NAMES:
             method = getattr(obj, name, None)
             if not callable(method):
                 continue
-            try:
-                method(order_id)
+            if _invoke_cancel(method, order_id):
+                _CANCEL_METHOD_CACHE[client_type] = (path, name)
                 return True
-            except TypeError:
-                try:
-                    method(id=order_id)
-                    return True
-                except Exception:
-                    continue
-            except Exception:
-                continue
         for attr in ("client", "api", "private"):
             nested = getattr(obj, attr, None)
             if nested is not None:
-                targets.append(nested)
+                targets.append((nested, path + (attr,)))
     return False
 
 
-def _order_tick(dp: int) -> float:
-    return 10 ** (-dp)
+# 盘口事件可以提前结束挂单期间的等待，但两次订单状态查询（REST）之间至少间隔该时长
+_MIN_STATUS_POLL_SEC = 1.0
+
+
+def _wait_for_book(change_event: threading.Event, timeout: float) -> bool:
+    """等待盘口变化事件，返回是否被唤醒。
+
+    被唤醒时立即清除事件，调用方随后才重读盘口；重读期间到达的新 ``set()``
+    会保留到下一次等待，不会丢失。超时返回时不清除。
+    """
+
+    if not change_event.wait(timeout):
+        return False
+    change_event.clear()
+    return True
+
+
+def _event_sleeper(change_event: threading.Event) -> Callable[[float], None]:
+    """无挂单时的等待：盘口一变化即返回，由循环开头重读盘口。"""
+
+    def _wait(timeout: float) -> None:
+        _wait_for_book(change_event, timeout)
+
+    return _wait
+
+
+def _wait_next_status_poll(
+    change_event: threading.Event,
+    poll_sec: float,
+    price_fn: Optional[Callable[[], Optional[float]]],
+    book_moved: Callable[[float], bool],
+    last_poll_at: float,
+    sleep_fn: Callable[[float], None],
+) -> None:
+    """挂单期间等待下一次状态查询。
+
+    盘口事件只触发重读 websocket 快照价，不查询订单状态；快照价越过重挂阈值
+    （``book_moved``）时才提前结束等待，且距上次状态查询不少于
+    ``_MIN_STATUS_POLL_SEC``，避免每个 tick 都打一次 ``get_order_status``。
+    """
+
+    deadline = time.monotonic() + poll_sec
+    while True:
+        left = deadline - time.monotonic()
+        if left <= 0 or not _wait_for_book(change_event, left):
+            return
+        price = _snapshot_price(price_fn)
+        if price is not None and book_moved(price):
+            break
+    now = time.monotonic()
+    gap = min(last_poll_at + _MIN_STATUS_POLL_SEC, deadline) - now
+    if gap > 0:
+        sleep_fn(gap)
+
+
+class _MakerSide:
+    """买/卖两个挂单循环共用流程中随方向变化的参数。"""
+
+    __slots__ = ("tag", "book_side", "price_dp", "size_dp", "fill_label")
+
+    def __init__(self, tag: str, book_side: str, price_dp: int, size_dp: int, fill_label: str) -> None:
+        self.tag = tag
+        self.book_side = book_side
+        self.price_dp = price_dp
+        self.size_dp = size_dp
+        self.fill_label = fill_label
+
+
+_BUY_SIDE = _MakerSide("[MAKER][BUY]", "bid", BUY_PRICE_DP, BUY_SIZE_DP, "filled")
+_SELL_SIDE = _MakerSide("[MAKER][SELL]", "ask", SELL_PRICE_DP, SELL_SIZE_DP, "sold")
+
+
+class OrderRecord:
+    """单笔挂单的轮询记录；返回给调用方前经 :meth:`as_dict` 转回字典。"""
+
+    __slots__ = ("id", "side", "price", "size", "status", "filled", "avg_price")
+
+    def __init__(self, order_id: str, side: str, price: float, size: float) -> None:
+        self.id = order_id
+        self.side = side
+        self.price = price
+        self.size = size
+        self.status = "OPEN"
+        self.filled = 0.0
+        self.avg_price: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "id": self.id,
+            "side": self.side,
+            "price": self.price,
+            "size": self.size,
+            "status": self.status,
+            "filled": self.filled,
+        }
+        if self.avg_price is not None:
+            data["avg_price"] = self.avg_price
+        return data
 
 
 def _update_fill_totals(
@@ -267,9 +543,14 @@ def _update_fill_totals(
     notional_sum: float,
     last_known_price: float,
     *,
-    status_text: Optional[str] = None,
+    status_upper: Optional[str] = None,
     expected_full_size: Optional[float] = None,
-) -> Tuple[float, float, float]:
+) -> Tuple[float, float, float, float]:
+    """更新单笔订单的累计成交，返回 (成交量, 均价, 名义金额累计, 累计成交变化量)。
+
+    变化量等于 ``accounted`` 中该订单记录的前后差值，调用方据此增量维护
+    所有订单的成交合计，无需每次轮询都对 ``accounted`` 求和。
+    """
     filled_amount = float(status_payload.get("filledAmount", 0.0) or 0.0)
     avg_price = status_payload.get("avgPrice")
     if avg_price is None:
@@ -277,17 +558,107 @@ def _update_fill_totals(
     else:
         avg_price = float(avg_price)
 
-    if filled_amount <= _MIN_FILL_EPS and status_text:
-        status_upper = status_text.upper()
-        if status_upper in {"FILLED", "MATCHED", "COMPLETED", "EXECUTED"}:
-            if expected_full_size is not None and expected_full_size > 0:
-                filled_amount = max(filled_amount, float(expected_full_size))
+    if filled_amount <= _MIN_FILL_EPS and status_upper in _FINAL_STATES:
+        if expected_full_size is not None and expected_full_size > 0:
+            filled_amount = max(filled_amount, float(expected_full_size))
 
     previous = accounted.get(order_id, 0.0)
     delta = max(filled_amount - previous, 0.0)
     accounted[order_id] = filled_amount
     notional_sum += delta * avg_price
-    return filled_amount, avg_price, notional_sum
+    return filled_amount, avg_price, notional_sum, filled_amount - previous
+
+
+def _cancel_tracked(client: Any, records: Dict[str, OrderRecord], order_id: str) -> None:
+    """撤销当前挂单并标记记录；挂单成功时即写入 ``records``，故无需判空。
+
+    撤单刻意在重挂之前同步完成，不与新挂单并发：旧单仍占用仓位/资金时，新卖单会
+    因余额不足被拒（进而触发缩量逻辑），新买单则可能与旧单同时成交导致超买。
+    """
+
+    _cancel_order(client, order_id)
+    records[order_id].status = "CANCELLED"
+
+
+def _poll_active_order(
+    side: _MakerSide,
+    adapter: Any,
+    client: Any,
+    token_id: str,
+    price_fn: Optional[Callable[[], Optional[float]]],
+    order_id: str,
+    records: Dict[str, OrderRecord],
+    accounted: Dict[str, float],
+    notional_sum: float,
+    active_price: Optional[float],
+    fallback_price: float,
+    status_fn: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
+) -> Tuple[str, Optional[float], float, float]:
+    """轮询当前挂单：查询状态（与盘口价并发）、累计成交并更新记录。
+
+    返回 (大写状态, 盘口价, 名义金额累计, 累计成交变化量)。
+    """
+
+    status_payload, status_error, price = _poll_status_and_price(
+        adapter, order_id, client, token_id, side.book_side, price_fn, status_fn
+    )
+    if status_payload is None:
+        logger.warning("%s 查询订单状态异常：%s", side.tag, status_error)
+        status_payload = {"status": "UNKNOWN", "filledAmount": accounted.get(order_id, 0.0)}
+
+    record = records.get(order_id)
+    status_text = str(status_payload.get("status", "UNKNOWN"))
+    # 状态只在这里归一化一次，后续记录、日志与返回值共用同一个大写字符串
+    status_text_upper = status_text if status_text in _UPPER_STATES else status_text.upper()
+    # 记录里的 size 在挂单时就已是取整后的 float，无需每轮再转换
+    record_size = record.size if record is not None else None
+    last_price_hint = active_price
+    if last_price_hint is None:
+        last_price_hint = _coerce_float(status_payload.get("avgPrice"))
+    if last_price_hint is None:
+        last_price_hint = fallback_price
+    filled_amount, avg_price, notional_sum, filled_change = _update_fill_totals(
+        order_id,
+        status_payload,
+        accounted,
+        notional_sum,
+        float(last_price_hint),
+        status_upper=status_text_upper,
+        expected_full_size=record_size,
+    )
+    if record is not None:
+        record.filled = filled_amount
+        record.status = status_text_upper
+        if avg_price is not None:
+            record.avg_price = avg_price
+        # 每轮轮询都会走到这里；INFO 被屏蔽时连参数也不必计算
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "%s 挂单状态 -> price=%.*f %s=%.*f remaining=%.*f status=%s",
+                side.tag, side.price_dp, record.price, side.fill_label, side.size_dp, filled_amount,
+                side.size_dp, max(record_size - filled_amount, 0.0), status_text_upper,
+            )
+    return status_text_upper, price, notional_sum, filled_change
+
+
+# 激进模式超时后的下调决策
+_AGGRESSIVE_HOLD = 0  # 取整后价格降不下去，保持原挂单并重新计时
+_AGGRESSIVE_REPRICE = 1  # 撤单并按更低价格重挂
+_AGGRESSIVE_FLOOR_LOCK = 2  # 再下调会跌破地板，锁定当前价格
+
+
+def _aggressive_step_decision(
+    active_price: float, step: float, floor_float: float, floor_lo: float
+) -> Tuple[int, float]:
+    """激进卖出超时后的纯数值决策，返回 (动作, 目标价格)，不触碰任何订单接口。"""
+
+    target_price = active_price - step
+    if target_price < floor_lo:
+        return _AGGRESSIVE_FLOOR_LOCK, active_price
+    next_px = max(_round_down_to_dp(target_price, SELL_PRICE_DP), floor_float)
+    if next_px >= active_price - 1e-12:
+        return _AGGRESSIVE_HOLD, next_px
+    return _AGGRESSIVE_REPRICE, next_px
 
 
 def maker_buy_follow_bid(
@@ -301,15 +672,17 @@ def maker_buy_follow_bid(
     best_bid_fn: Optional[Callable[[], Optional[float]]] = None,
     stop_check: Optional[Callable[[], bool]] = None,
     sleep_fn: Callable[[float], None] = time.sleep,
+    change_event: Optional[threading.Event] = None,
+    order_status_fn: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
     progress_probe: Optional[Callable[[], None]] = None,
     progress_probe_interval: float = 60.0,
 ) -> Dict[str, Any]:
     """Continuously maintain a maker buy order following the market bid."""
 
-    goal_size = max(_ceil_to_dp(float(target_size), BUY_SIZE_DP), 0.0)
+    goal_size = max(_ceil_to_dp(float(target_size), _BUY_SIZE_FACTOR), 0.0)
     api_min_qty = 0.0
     if min_order_size and min_order_size > 0:
-        api_min_qty = _ceil_to_dp(float(min_order_size), BUY_SIZE_DP)
+        api_min_qty = _ceil_to_dp(float(min_order_size), _BUY_SIZE_FACTOR)
         goal_size = max(goal_size, api_min_qty)
     if goal_size <= 0:
         return {
@@ -321,8 +694,9 @@ def maker_buy_follow_bid(
         }
 
     adapter = ClobPolymarketAPI(client)
-    orders: List[Dict[str, Any]] = []
-    records: Dict[str, Dict[str, Any]] = {}
+    idle_wait = sleep_fn if change_event is None else _event_sleeper(change_event)
+    orders: List[OrderRecord] = []
+    records: Dict[str, OrderRecord] = {}
     accounted: Dict[str, float] = {}
 
     remaining = goal_size
@@ -333,17 +707,27 @@ def maker_buy_follow_bid(
     active_price: Optional[float] = None
 
     final_status = "PENDING"
-    tick = _order_tick(BUY_PRICE_DP)
-
     next_probe_at = 0.0
+    last_poll_at = 0.0
+    # 本轮状态轮询时取到的买一；紧接着重挂时直接复用，避免再走一遍 REST 探测
+    polled_bid: Optional[float] = None
+    # 下单参数模板：每次挂单复制一份再填价格与数量，适配器/客户端持有或改写
+    # 传入的字典也不会影响后续重挂
+    order_template: Dict[str, Any] = {
+        "tokenId": token_id,
+        "side": "BUY",
+        "price": 0.0,
+        "size": 0.0,
+        "timeInForce": "GTC",
+        "type": "GTC",
+        "allowPartial": True,
+    }
 
     while True:
         if stop_check and stop_check():
             if active_order:
-                _cancel_order(client, active_order)
-                rec = records.get(active_order)
-                if rec is not None:
-                    rec["status"] = "CANCELLED"
+                _cancel_tracked(client, records, active_order)
+                active_order = active_price = None
             final_status = "STOPPED"
             break
 
@@ -351,160 +735,110 @@ def maker_buy_follow_bid(
             if api_min_qty and remaining + _MIN_FILL_EPS < api_min_qty:
                 final_status = "FILLED_TRUNCATED" if filled_total > _MIN_FILL_EPS else "SKIPPED_TOO_SMALL"
                 break
-            bid = _best_bid(client, token_id, best_bid_fn)
+            bid = polled_bid if polled_bid is not None else _best_bid(client, token_id, best_bid_fn)
+            polled_bid = None
             if bid is None or bid <= 0:
-                sleep_fn(poll_sec)
+                idle_wait(poll_sec)
                 continue
             px = _round_up_to_dp(bid, BUY_PRICE_DP)
             if px <= 0:
-                sleep_fn(poll_sec)
+                idle_wait(poll_sec)
                 continue
             min_qty = 0.0
             if min_quote_amt and min_quote_amt > 0:
-                min_qty = _ceil_to_dp(min_quote_amt / max(px, 1e-9), BUY_SIZE_DP)
+                min_qty = _ceil_to_dp(min_quote_amt / px, _BUY_SIZE_FACTOR)
             eff_qty = max(remaining, min_qty)
             if api_min_qty:
                 eff_qty = max(eff_qty, api_min_qty)
-            eff_qty = _ceil_to_dp(eff_qty, BUY_SIZE_DP)
+            eff_qty = _ceil_to_dp(eff_qty, _BUY_SIZE_FACTOR)
             if eff_qty <= 0:
                 final_status = "SKIPPED"
                 break
-            payload = {
-                "tokenId": token_id,
-                "side": "BUY",
-                "price": px,
-                "size": eff_qty,
-                "timeInForce": "GTC",
-                "type": "GTC",
-                "allowPartial": True,
-            }
-            response = adapter.create_order(payload)
+            order_payload = order_template.copy()
+            order_payload["price"] = px
+            order_payload["size"] = eff_qty
+            response = adapter.create_order(order_payload)
             order_id = str(response.get("orderId"))
-            record = {
-                "id": order_id,
-                "side": "buy",
-                "price": px,
-                "size": eff_qty,
-                "status": "OPEN",
-                "filled": 0.0,
-            }
+            record = OrderRecord(order_id, "buy", px, eff_qty)
             orders.append(record)
             records[order_id] = record
             accounted[order_id] = 0.0
             active_order = order_id
             active_price = px
+            last_poll_at = time.monotonic()
             if progress_probe:
                 interval = max(progress_probe_interval, poll_sec, 1e-6)
                 try:
                     progress_probe()
-                except Exception as probe_exc:
-                    print(f"[MAKER][BUY] 进度探针执行异常：{probe_exc}")
-                next_probe_at = time.time() + interval
-            print(
-                f"[MAKER][BUY] 挂单 -> price={px:.{BUY_PRICE_DP}f} qty={eff_qty:.{BUY_SIZE_DP}f} remaining={remaining:.{BUY_SIZE_DP}f}"
+                except Exception:
+                    logger.exception("[MAKER][BUY] 进度探针执行异常")
+                next_probe_at = time.monotonic() + interval
+            logger.info(
+                "[MAKER][BUY] 挂单 -> price=%.*f qty=%.*f remaining=%.*f",
+                BUY_PRICE_DP, px, BUY_SIZE_DP, eff_qty, BUY_SIZE_DP, remaining,
             )
             continue
 
-        sleep_fn(poll_sec)
+        if change_event is None:
+            sleep_fn(poll_sec)
+        else:
+            reprice_at = active_price + _BUY_TICK - 1e-12
+            _wait_next_status_poll(
+                change_event, poll_sec, best_bid_fn,
+                lambda bid: bid >= reprice_at, last_poll_at, sleep_fn,
+            )
         if (
             progress_probe
             and active_order
             and progress_probe_interval > 0
-            and time.time() >= max(next_probe_at, 0.0)
+            and time.monotonic() >= next_probe_at
         ):
             try:
                 progress_probe()
-            except Exception as probe_exc:
-                print(f"[MAKER][BUY] 进度探针执行异常：{probe_exc}")
-            interval = max(progress_probe_interval, poll_sec, 1e-6)
-            next_probe_at = time.time() + interval
-        try:
-            status_payload = adapter.get_order_status(active_order)
-        except Exception as exc:
-            print(f"[MAKER][BUY] 查询订单状态异常：{exc}")
-            status_payload = {"status": "UNKNOWN", "filledAmount": accounted.get(active_order, 0.0)}
-
-        record = records.get(active_order)
-        status_text = str(status_payload.get("status", "UNKNOWN"))
-        record_size = None
-        if record is not None:
-            try:
-                record_size = float(record.get("size", 0.0) or 0.0)
             except Exception:
-                record_size = None
-        last_price_hint = active_price
-        if last_price_hint is None:
-            last_price_hint = _coerce_float(status_payload.get("avgPrice"))
-        if last_price_hint is None:
-            last_price_hint = 0.0
-        filled_amount, avg_price, notional_sum = _update_fill_totals(
-            active_order,
-            status_payload,
-            accounted,
-            notional_sum,
-            float(last_price_hint),
-            status_text=status_text,
-            expected_full_size=record_size,
+                logger.exception("[MAKER][BUY] 进度探针执行异常")
+            interval = max(progress_probe_interval, poll_sec, 1e-6)
+            next_probe_at = time.monotonic() + interval
+        last_poll_at = time.monotonic()
+        status_text_upper, current_bid, notional_sum, filled_change = _poll_active_order(
+            _BUY_SIDE, adapter, client, token_id, best_bid_fn,
+            active_order, records, accounted, notional_sum, active_price, 0.0,
+            order_status_fn,
         )
-        filled_total = sum(accounted.values())
+        polled_bid = current_bid
+        filled_total += filled_change
         remaining = max(goal_size - filled_total, 0.0)
-        status_text_upper = status_text.upper()
-        if record is not None:
-            record["filled"] = filled_amount
-            record["status"] = status_text_upper
-            if avg_price is not None:
-                record["avg_price"] = avg_price
-            price_display = record.get("price", active_price)
-            total_size = float(record.get("size", 0.0) or 0.0)
-            remaining_slice = max(total_size - filled_amount, 0.0)
-            if price_display is not None:
-                print(
-                    f"[MAKER][BUY] 挂单状态 -> price={float(price_display):.{BUY_PRICE_DP}f} "
-                    f"filled={filled_amount:.{BUY_SIZE_DP}f} remaining={remaining_slice:.{BUY_SIZE_DP}f} "
-                    f"status={status_text_upper}"
-                )
 
-        current_bid = _best_bid(client, token_id, best_bid_fn)
         min_buyable = 0.0
         if min_quote_amt and min_quote_amt > 0 and current_bid and current_bid > 0:
-            min_buyable = _ceil_to_dp(min_quote_amt / max(current_bid, 1e-9), BUY_SIZE_DP)
+            min_buyable = _ceil_to_dp(min_quote_amt / current_bid, _BUY_SIZE_FACTOR)
         if api_min_qty:
             min_buyable = max(min_buyable, api_min_qty)
 
         if remaining <= _MIN_FILL_EPS or (min_buyable and remaining < min_buyable):
             if active_order:
-                _cancel_order(client, active_order)
-                rec = records.get(active_order)
-                if rec is not None:
-                    rec["status"] = "CANCELLED"
-                active_order = None
+                _cancel_tracked(client, records, active_order)
+                active_order = active_price = None
             if remaining <= _MIN_FILL_EPS:
                 final_status = "FILLED"
             else:
                 final_status = "FILLED_TRUNCATED" if filled_total > _MIN_FILL_EPS else "SKIPPED_TOO_SMALL"
             break
 
-        if current_bid is not None and active_price is not None and current_bid >= active_price + tick - 1e-12:
-            print(
-                f"[MAKER][BUY] 买一上行 -> 撤单重挂 | old={active_price:.{BUY_PRICE_DP}f} new={current_bid:.{BUY_PRICE_DP}f}"
+        if current_bid is not None and active_price is not None and current_bid >= active_price + _BUY_TICK - 1e-12:
+            logger.info(
+                "[MAKER][BUY] 买一上行 -> 撤单重挂 | old=%.*f new=%.*f",
+                BUY_PRICE_DP, active_price, BUY_PRICE_DP, current_bid,
             )
-            _cancel_order(client, active_order)
-            rec = records.get(active_order)
-            if rec is not None:
-                rec["status"] = "CANCELLED"
-            active_order = None
-            active_price = None
+            _cancel_tracked(client, records, active_order)
+            active_order = active_price = None
             continue
 
-        final_states = {"FILLED", "MATCHED", "COMPLETED", "EXECUTED"}
-        cancel_states = {"CANCELLED", "CANCELED", "REJECTED", "EXPIRED"}
-        if status_text_upper in final_states:
-            active_order = None
-            active_price = None
+        if status_text_upper in _FINAL_STATES:
+            active_order = active_price = None
             continue
-        if status_text_upper in cancel_states:
-            active_order = None
-            active_price = None
+        if status_text_upper in _CANCEL_STATES:
+            active_order = active_price = None
             continue
 
     avg_price = notional_sum / filled_total if filled_total > 0 else None
@@ -514,7 +848,7 @@ def maker_buy_follow_bid(
         "avg_price": avg_price,
         "filled": filled_total,
         "remaining": remaining,
-        "orders": orders,
+        "orders": [record.as_dict() for record in orders],
     }
 
 
@@ -529,16 +863,18 @@ def maker_sell_follow_ask_with_floor_wait(
     best_ask_fn: Optional[Callable[[], Optional[float]]] = None,
     stop_check: Optional[Callable[[], bool]] = None,
     sleep_fn: Callable[[float], None] = time.sleep,
+    change_event: Optional[threading.Event] = None,
+    order_status_fn: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
     sell_mode: str = "conservative",
     aggressive_step: float = 0.01,
     aggressive_timeout: float = 120.0,
 ) -> Dict[str, Any]:
     """Maintain a maker sell order while respecting a profit floor."""
 
-    goal_size = max(_floor_to_dp(float(position_size), SELL_SIZE_DP), 0.0)
+    goal_size = max(_floor_to_dp(float(position_size), _SELL_SIZE_FACTOR), 0.0)
     api_min_qty = 0.0
     if min_order_size and min_order_size > 0:
-        api_min_qty = _ceil_to_dp(float(min_order_size), SELL_SIZE_DP)
+        api_min_qty = _ceil_to_dp(float(min_order_size), _SELL_SIZE_FACTOR)
     if goal_size < 0.01:
         return {
             "status": "SKIPPED",
@@ -549,8 +885,9 @@ def maker_sell_follow_ask_with_floor_wait(
         }
 
     adapter = ClobPolymarketAPI(client)
-    orders: List[Dict[str, Any]] = []
-    records: Dict[str, Dict[str, Any]] = {}
+    idle_wait = sleep_fn if change_event is None else _event_sleeper(change_event)
+    orders: List[OrderRecord] = []
+    records: Dict[str, OrderRecord] = {}
     accounted: Dict[str, float] = {}
 
     remaining = goal_size
@@ -559,13 +896,15 @@ def maker_sell_follow_ask_with_floor_wait(
 
     active_order: Optional[str] = None
     active_price: Optional[float] = None
+    # 重挂阈值 px - tick - 1e-12：卖一须比挂单价低出一档以上才撤单重挂（恰好低一档时
+    # 浮点误差使其略高于阈值，不触发）。随挂单价一次算好，轮询时只做一次比较
+    reprice_below = 0.0
+    last_poll_at = 0.0
     waiting_for_floor = False
 
     final_status = "PENDING"
-    tick = _order_tick(SELL_PRICE_DP)
-
     aggressive_mode = str(sell_mode).lower() == "aggressive"
-    aggressive_timer_start: Optional[float] = None
+    aggressive_timer_start: Optional[int] = None  # time.monotonic_ns()
     aggressive_floor_locked = False
     aggressive_next_price_override: Optional[float] = None
     aggressive_locked_price: Optional[float] = None
@@ -573,6 +912,10 @@ def maker_sell_follow_ask_with_floor_wait(
         aggressive_timeout = float(aggressive_timeout)
     except (TypeError, ValueError):
         aggressive_timeout = 120.0
+    # 非有限超时（inf/nan）等价于永不超时
+    aggressive_timeout_ns = (
+        int(aggressive_timeout * 1e9) if math.isfinite(aggressive_timeout) else 1 << 62
+    )
     try:
         aggressive_step = float(aggressive_step)
     except (TypeError, ValueError):
@@ -580,15 +923,28 @@ def maker_sell_follow_ask_with_floor_wait(
     if aggressive_step <= 0:
         aggressive_mode = False
     floor_float = float(floor_X)
+    # 带容差的地板阈值，整个卖出流程内不变
+    floor_hi = floor_float + 1e-12
+    floor_lo = floor_float - 1e-12
+    # 本轮状态轮询时取到的卖一；下一轮开头直接复用，避免重复的 REST 探测
+    polled_ask: Optional[float] = None
+    # 下单参数模板：每次挂单复制一份再填价格与数量，适配器/客户端持有或改写
+    # 传入的字典也不会影响后续重挂
+    order_template: Dict[str, Any] = {
+        "tokenId": token_id,
+        "side": "SELL",
+        "price": 0.0,
+        "size": 0.0,
+        "timeInForce": "GTC",
+        "type": "GTC",
+        "allowPartial": True,
+    }
 
     while True:
         if stop_check and stop_check():
             if active_order:
-                _cancel_order(client, active_order)
-                rec = records.get(active_order)
-                if rec is not None:
-                    rec["status"] = "CANCELLED"
-                aggressive_timer_start = None
+                _cancel_tracked(client, records, active_order)
+                active_order = active_price = aggressive_timer_start = aggressive_next_price_override = None
             final_status = "STOPPED"
             break
 
@@ -596,37 +952,27 @@ def maker_sell_follow_ask_with_floor_wait(
             final_status = "FILLED_TRUNCATED" if filled_total > _MIN_FILL_EPS else "SKIPPED_TOO_SMALL"
             break
 
-        ask = _best_ask(client, token_id, best_ask_fn)
+        ask = polled_ask if polled_ask is not None else _best_ask(client, token_id, best_ask_fn)
+        polled_ask = None
         if ask is None or ask <= 0:
             waiting_for_floor = True
             if active_order:
-                _cancel_order(client, active_order)
-                rec = records.get(active_order)
-                if rec is not None:
-                    rec["status"] = "CANCELLED"
-                active_order = None
-                active_price = None
-                aggressive_timer_start = None
-                aggressive_next_price_override = None
-            sleep_fn(poll_sec)
+                _cancel_tracked(client, records, active_order)
+                active_order = active_price = aggressive_timer_start = aggressive_next_price_override = None
+            idle_wait(poll_sec)
             continue
 
-        if ask < floor_X - 1e-12:
+        if ask < floor_lo:
             if not waiting_for_floor:
-                print(
-                    f"[MAKER][SELL] 卖一跌破地板，撤单等待 | ask={ask:.{SELL_PRICE_DP}f} floor={floor_X:.{SELL_PRICE_DP}f}"
+                logger.info(
+                    "[MAKER][SELL] 卖一跌破地板，撤单等待 | ask=%.*f floor=%.*f",
+                    SELL_PRICE_DP, ask, SELL_PRICE_DP, floor_X,
                 )
             waiting_for_floor = True
             if active_order:
-                _cancel_order(client, active_order)
-                rec = records.get(active_order)
-                if rec is not None:
-                    rec["status"] = "CANCELLED"
-                active_order = None
-                active_price = None
-                aggressive_timer_start = None
-                aggressive_next_price_override = None
-            sleep_fn(poll_sec)
+                _cancel_tracked(client, records, active_order)
+                active_order = active_price = aggressive_timer_start = aggressive_next_price_override = None
+            idle_wait(poll_sec)
             continue
 
         if waiting_for_floor and ask >= floor_X:
@@ -649,24 +995,18 @@ def maker_sell_follow_ask_with_floor_wait(
             else:
                 aggressive_next_price_override = None
             px = px_candidate
-            qty = _floor_to_dp(remaining, SELL_SIZE_DP)
+            qty = _floor_to_dp(remaining, _SELL_SIZE_FACTOR)
             if qty < 0.01:
                 final_status = "FILLED"
                 break
             if api_min_qty and qty + _MIN_FILL_EPS < api_min_qty:
                 final_status = "FILLED_TRUNCATED" if filled_total > _MIN_FILL_EPS else "SKIPPED_TOO_SMALL"
                 break
-            payload = {
-                "tokenId": token_id,
-                "side": "SELL",
-                "price": px,
-                "size": qty,
-                "timeInForce": "GTC",
-                "type": "GTC",
-                "allowPartial": True,
-            }
+            order_payload = order_template.copy()
+            order_payload["price"] = px
+            order_payload["size"] = qty
             try:
-                response = adapter.create_order(payload)
+                response = adapter.create_order(order_payload)
             except Exception as exc:
                 msg = str(exc).lower()
                 insufficient = any(
@@ -674,13 +1014,13 @@ def maker_sell_follow_ask_with_floor_wait(
                 )
                 if insufficient:
                     current_remaining = max(goal_size - filled_total, 0.0)
-                    shrink_qty = _floor_to_dp(max(current_remaining - tick, 0.0), SELL_SIZE_DP)
+                    shrink_qty = _floor_to_dp(max(current_remaining - _SELL_TICK, 0.0), _SELL_SIZE_FACTOR)
                     if shrink_qty >= 0.01 and (
                         not api_min_qty or shrink_qty + _MIN_FILL_EPS >= api_min_qty
                     ):
-                        print(
-                            "[MAKER][SELL] 可用仓位不足，调整卖出数量后重试 -> "
-                            f"old={qty:.{SELL_SIZE_DP}f} new={shrink_qty:.{SELL_SIZE_DP}f}"
+                        logger.warning(
+                            "[MAKER][SELL] 可用仓位不足，调整卖出数量后重试 -> old=%.*f new=%.*f",
+                            SELL_SIZE_DP, qty, SELL_SIZE_DP, shrink_qty,
                         )
                         goal_size = filled_total + shrink_qty
                         remaining = max(goal_size - filled_total, 0.0)
@@ -689,202 +1029,129 @@ def maker_sell_follow_ask_with_floor_wait(
                         "FILLED_TRUNCATED" if filled_total > _MIN_FILL_EPS else "SKIPPED_TOO_SMALL"
                     )
                     remaining = max(goal_size - filled_total, 0.0)
-                    print(
-                        "[MAKER][SELL] 可用仓位低于最小挂单量，放弃后续卖出尝试。"
-                    )
+                    logger.warning("[MAKER][SELL] 可用仓位低于最小挂单量，放弃后续卖出尝试。")
                     break
                 raise
             order_id = str(response.get("orderId"))
-            record = {
-                "id": order_id,
-                "side": "sell",
-                "price": px,
-                "size": qty,
-                "status": "OPEN",
-                "filled": 0.0,
-            }
+            record = OrderRecord(order_id, "sell", px, qty)
             orders.append(record)
             records[order_id] = record
             accounted[order_id] = 0.0
             active_order = order_id
             active_price = px
+            reprice_below = px - _SELL_TICK - 1e-12
+            last_poll_at = time.monotonic()
             if aggressive_mode:
-                if px <= floor_float + 1e-12:
+                if px <= floor_hi:
                     aggressive_locked_price = px
                 if aggressive_locked_price is not None:
                     aggressive_floor_locked = True
                     aggressive_timer_start = None
                 else:
                     aggressive_floor_locked = False
-                    aggressive_timer_start = time.time()
-            print(
-                f"[MAKER][SELL] 挂单 -> price={px:.{SELL_PRICE_DP}f} qty={qty:.{SELL_SIZE_DP}f} remaining={remaining:.{SELL_SIZE_DP}f}"
+                    aggressive_timer_start = time.monotonic_ns()
+            logger.info(
+                "[MAKER][SELL] 挂单 -> price=%.*f qty=%.*f remaining=%.*f",
+                SELL_PRICE_DP, px, SELL_SIZE_DP, qty, SELL_SIZE_DP, remaining,
             )
             continue
 
-        sleep_fn(poll_sec)
-        try:
-            status_payload = adapter.get_order_status(active_order)
-        except Exception as exc:
-            print(f"[MAKER][SELL] 查询订单状态异常：{exc}")
-            status_payload = {"status": "UNKNOWN", "filledAmount": accounted.get(active_order, 0.0)}
-
-        record = records.get(active_order)
-        status_text = str(status_payload.get("status", "UNKNOWN"))
-        record_size = None
-        if record is not None:
-            try:
-                record_size = float(record.get("size", 0.0) or 0.0)
-            except Exception:
-                record_size = None
-        last_price_hint = active_price
-        if last_price_hint is None:
-            last_price_hint = _coerce_float(status_payload.get("avgPrice"))
-        if last_price_hint is None:
-            last_price_hint = floor_X
-        filled_amount, avg_price, notional_sum = _update_fill_totals(
-            active_order,
-            status_payload,
-            accounted,
-            notional_sum,
-            float(last_price_hint),
-            status_text=status_text,
-            expected_full_size=record_size,
+        if change_event is None:
+            sleep_fn(poll_sec)
+        else:
+            _wait_next_status_poll(
+                change_event, poll_sec, best_ask_fn,
+                lambda ask: ask < floor_lo or ask <= reprice_below, last_poll_at, sleep_fn,
+            )
+        last_poll_at = time.monotonic()
+        status_text_upper, ask, notional_sum, filled_change = _poll_active_order(
+            _SELL_SIDE, adapter, client, token_id, best_ask_fn,
+            active_order, records, accounted, notional_sum, active_price, floor_X,
+            order_status_fn,
         )
-        filled_total = sum(accounted.values())
+        polled_ask = ask
+        filled_total += filled_change
         remaining = max(goal_size - filled_total, 0.0)
-        status_text_upper = status_text.upper()
-        if record is not None:
-            record["filled"] = filled_amount
-            record["status"] = status_text_upper
-            if avg_price is not None:
-                record["avg_price"] = avg_price
-            price_display = record.get("price", active_price)
-            total_size = float(record.get("size", 0.0) or 0.0)
-            remaining_slice = max(total_size - filled_amount, 0.0)
-            if price_display is not None:
-                print(
-                    f"[MAKER][SELL] 挂单状态 -> price={float(price_display):.{SELL_PRICE_DP}f} "
-                    f"sold={filled_amount:.{SELL_SIZE_DP}f} remaining={remaining_slice:.{SELL_SIZE_DP}f} "
-                    f"status={status_text_upper}"
-                )
 
         if api_min_qty and remaining < api_min_qty:
             if active_order:
-                _cancel_order(client, active_order)
-                rec = records.get(active_order)
-                if rec is not None:
-                    rec["status"] = "CANCELLED"
-                active_order = None
-                active_price = None
-                aggressive_timer_start = None
-                aggressive_next_price_override = None
+                _cancel_tracked(client, records, active_order)
+                active_order = active_price = aggressive_timer_start = aggressive_next_price_override = None
             final_status = "FILLED_TRUNCATED" if filled_total > _MIN_FILL_EPS else "SKIPPED_TOO_SMALL"
             break
 
-        if remaining <= 0.0 or _floor_to_dp(remaining, SELL_SIZE_DP) < 0.01:
+        if remaining <= 0.0 or _floor_to_dp(remaining, _SELL_SIZE_FACTOR) < 0.01:
             if active_order:
-                _cancel_order(client, active_order)
-                rec = records.get(active_order)
-                if rec is not None:
-                    rec["status"] = "CANCELLED"
-                active_order = None
-                aggressive_timer_start = None
-                aggressive_next_price_override = None
+                _cancel_tracked(client, records, active_order)
+                active_order = active_price = aggressive_timer_start = aggressive_next_price_override = None
             final_status = "FILLED"
             break
 
-        ask = _best_ask(client, token_id, best_ask_fn)
         if ask is None:
             continue
 
-        if ask < floor_X - 1e-12:
-            print(
-                f"[MAKER][SELL] 卖一再次跌破地板，撤单等待 | ask={ask:.{SELL_PRICE_DP}f} floor={floor_X:.{SELL_PRICE_DP}f}"
+        if ask < floor_lo:
+            logger.info(
+                "[MAKER][SELL] 卖一再次跌破地板，撤单等待 | ask=%.*f floor=%.*f",
+                SELL_PRICE_DP, ask, SELL_PRICE_DP, floor_X,
             )
-            _cancel_order(client, active_order)
-            rec = records.get(active_order)
-            if rec is not None:
-                rec["status"] = "CANCELLED"
-            active_order = None
-            active_price = None
+            _cancel_tracked(client, records, active_order)
+            active_order = active_price = aggressive_timer_start = aggressive_next_price_override = None
             waiting_for_floor = True
-            aggressive_timer_start = None
-            aggressive_next_price_override = None
             continue
 
         if aggressive_mode and active_order and not waiting_for_floor:
-            if active_price is not None and active_price <= floor_float + 1e-12:
+            if active_price is not None and active_price <= floor_hi:
                 aggressive_locked_price = active_price
                 aggressive_floor_locked = True
                 aggressive_timer_start = None
             if not aggressive_floor_locked and active_price is not None:
+                now_ns = time.monotonic_ns()
                 if aggressive_timer_start is None:
-                    aggressive_timer_start = time.time()
-                elapsed = time.time() - aggressive_timer_start
-                if elapsed >= aggressive_timeout:
-                    target_price = active_price - aggressive_step
-                    if target_price >= floor_float - 1e-12:
-                        next_px = max(
-                            _round_down_to_dp(target_price, SELL_PRICE_DP),
-                            floor_float,
-                        )
-                        if next_px >= active_price - 1e-12:
-                            aggressive_timer_start = time.time()
-                            if next_px <= floor_float + 1e-12:
-                                aggressive_locked_price = next_px
-                                aggressive_floor_locked = True
-                                aggressive_timer_start = None
-                        else:
-                            print(
-                                "[MAKER][SELL][激进] 挂单超时未成交，下调挂价 -> "
-                                f"old={active_price:.{SELL_PRICE_DP}f} new={next_px:.{SELL_PRICE_DP}f}"
-                            )
-                            _cancel_order(client, active_order)
-                            rec = records.get(active_order)
-                            if rec is not None:
-                                rec["status"] = "CANCELLED"
-                            active_order = None
-                            active_price = None
-                            aggressive_next_price_override = next_px
+                    aggressive_timer_start = now_ns
+                if now_ns - aggressive_timer_start >= aggressive_timeout_ns:
+                    step_action, next_px = _aggressive_step_decision(
+                        active_price, aggressive_step, floor_float, floor_lo
+                    )
+                    if step_action == _AGGRESSIVE_HOLD:
+                        aggressive_timer_start = now_ns
+                        if next_px <= floor_hi:
+                            aggressive_locked_price = next_px
+                            aggressive_floor_locked = True
                             aggressive_timer_start = None
-                            if next_px <= floor_float + 1e-12:
-                                aggressive_locked_price = next_px
-                                aggressive_floor_locked = True
-                            continue
+                    elif step_action == _AGGRESSIVE_REPRICE:
+                        logger.info(
+                            "[MAKER][SELL][激进] 挂单超时未成交，下调挂价 -> old=%.*f new=%.*f",
+                            SELL_PRICE_DP, active_price, SELL_PRICE_DP, next_px,
+                        )
+                        _cancel_tracked(client, records, active_order)
+                        # 与其他撤单分支同样一次性清空，再写入下调后的目标价
+                        active_order = active_price = aggressive_timer_start = None
+                        aggressive_next_price_override = next_px
+                        if next_px <= floor_hi:
+                            aggressive_locked_price = next_px
+                            aggressive_floor_locked = True
+                        continue
                     else:
                         aggressive_locked_price = active_price
                         aggressive_floor_locked = True
                         aggressive_timer_start = None
 
-        if active_price is not None and ask <= active_price - tick - 1e-12:
-            new_px = max(_round_down_to_dp(ask, SELL_PRICE_DP), float(floor_X))
-            print(
-                f"[MAKER][SELL] 卖一下行 -> 撤单重挂 | old={active_price:.{SELL_PRICE_DP}f} new={new_px:.{SELL_PRICE_DP}f}"
+        if active_price is not None and ask <= reprice_below:
+            new_px = max(_round_down_to_dp(ask, SELL_PRICE_DP), floor_float)
+            logger.info(
+                "[MAKER][SELL] 卖一下行 -> 撤单重挂 | old=%.*f new=%.*f",
+                SELL_PRICE_DP, active_price, SELL_PRICE_DP, new_px,
             )
-            _cancel_order(client, active_order)
-            rec = records.get(active_order)
-            if rec is not None:
-                rec["status"] = "CANCELLED"
-            active_order = None
-            active_price = None
-            aggressive_timer_start = None
-            aggressive_next_price_override = None
+            _cancel_tracked(client, records, active_order)
+            active_order = active_price = aggressive_timer_start = aggressive_next_price_override = None
             continue
 
-        final_states = {"FILLED", "MATCHED", "COMPLETED", "EXECUTED"}
-        cancel_states = {"CANCELLED", "CANCELED", "REJECTED", "EXPIRED"}
-        if status_text_upper in final_states:
-            active_order = None
-            active_price = None
-            aggressive_timer_start = None
-            aggressive_next_price_override = None
+        if status_text_upper in _FINAL_STATES:
+            active_order = active_price = aggressive_timer_start = aggressive_next_price_override = None
             continue
-        if status_text_upper in cancel_states:
-            active_order = None
-            active_price = None
-            aggressive_timer_start = None
-            aggressive_next_price_override = None
+        if status_text_upper in _CANCEL_STATES:
+            active_order = active_price = aggressive_timer_start = aggressive_next_price_override = None
             continue
 
     avg_price = notional_sum / filled_total if filled_total > 0 else None
@@ -894,5 +1161,5 @@ def maker_sell_follow_ask_with_floor_wait(
         "avg_price": avg_price,
         "filled": filled_total,
         "remaining": remaining,
-        "orders": orders,
+        "orders": [record.as_dict() for record in orders],
     }
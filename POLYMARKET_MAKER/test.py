@@ -6,9 +6,15 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from collections import defaultdict
 from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Tuple
 
+try:  # 可选依赖：大仓位列表的 --raw/--verbose 输出明显更快
+    import orjson
+except ImportError:  # 回退标准库 json
+    orjson = None
+
 from Volatility_arbitrage_run import (
     _extract_avg_price_from_entry,
     _extract_position_size_from_entry,
@@ -19,24 +25,34 @@ from Volatility_arbitrage_run import (
 )
 
 
+# 按优先级排列；集合版本仅用于快速判断候选字典是否含有任一字段
+_TOKEN_KEYS = (
+    "tokenId",
+    "token_id",
+    "clobTokenId",
+    "clob_token_id",
+    "assetId",
+    "asset_id",
+    "asset",
+    "id",
+)
+_TOKEN_KEY_SET = frozenset(_TOKEN_KEYS)
+
+
 def _extract_token_identifier(entry: Dict[str, Any]) -> Optional[str]:
     """尽可能从仓位条目中提取 tokenId/assetId."""
 
     if not isinstance(entry, dict):
         return None
+    return _token_from_candidates(_position_dict_candidates(entry))
 
-    keys = (
-        "tokenId",
-        "token_id",
-        "clobTokenId",
-        "clob_token_id",
-        "assetId",
-        "asset_id",
-        "asset",
-        "id",
-    )
-    for cand in _position_dict_candidates(entry):
-        for key in keys:
+
+def _token_from_candidates(candidates: List[Dict[str, Any]]) -> Optional[str]:
+    for cand in candidates:
+        # 多数候选字典不含任何 token 字段，先用集合判交集整体跳过
+        if _TOKEN_KEY_SET.isdisjoint(cand):
+            continue
+        for key in _TOKEN_KEYS:
             val = cand.get(key)
             if val is None:
                 continue
@@ -49,6 +65,12 @@ def _extract_token_identifier(entry: Dict[str, Any]) -> Optional[str]:
 def _extract_market_metadata(entry: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """提取市场标题、结果标签及状态信息，便于解释来源。"""
 
+    return _metadata_from_candidates(_position_dict_candidates(entry))
+
+
+def _metadata_from_candidates(
+    candidates: List[Dict[str, Any]],
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     market_title: Optional[str] = None
     outcome_label: Optional[str] = None
     status_text: Optional[str] = None
@@ -61,7 +83,7 @@ def _extract_market_metadata(entry: Dict[str, Any]) -> Tuple[Optional[str], Opti
             return stripped or None
         return str(text)
 
-    for cand in _position_dict_candidates(entry):
+    for cand in candidates:
         if market_title is None:
             market = cand.get("market") or cand.get("marketInfo") or cand.get("market_data")
             if isinstance(market, dict):
@@ -111,6 +133,42 @@ def _extract_market_metadata(entry: Dict[str, Any]) -> Tuple[Optional[str], Opti
     return market_title, outcome_label, status_text
 
 
+_PositionFields = Tuple[
+    str, float, Optional[float], Optional[str], Optional[str], Optional[str]
+]
+
+
+def _extract_position_fields(entry: Dict[str, Any]) -> _PositionFields:
+    """一次性提取 (token, size, avg_price, market, outcome, status)，候选字典只构造一次。"""
+
+    candidates = _position_dict_candidates(entry)
+    token_id = _token_from_candidates(candidates) or "?"
+    size = _extract_position_size_from_entry(entry) or 0.0
+    avg_price = _extract_avg_price_from_entry(entry)
+    market_title, outcome_label, status_text = _metadata_from_candidates(candidates)
+    return token_id, size, avg_price, market_title, outcome_label, status_text
+
+
+def _new_summary_entry() -> Dict[str, Any]:
+    return {"size": 0.0, "avg": None, "count": 0, "market": None, "outcome": None, "status": None}
+
+
+def _json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # 超过 64 位的整数等 orjson 不支持的值，交给 json 处理
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _token_sort_key(token_id: str) -> Tuple[int, Any]:
+    # token id 多为 77 位十进制串，按整数比较比逐字符比较快；非数字 id（如 "?"）排在最后
+    if token_id.isdigit():
+        return 0, int(token_id)
+    return 1, token_id
+
+
 def _build_client(address: Optional[str]) -> SimpleNamespace:
     client = SimpleNamespace()
     if address:
@@ -160,30 +218,28 @@ def main() -> int:
     print(f"[OK] 查询成功，来源：{origin}")
     print(f"[INFO] 地址来源：{address_source}")
 
-    data: List[Dict[str, Any]] = [p for p in positions if isinstance(p, dict)]
-    if args.token:
-        token_filter = str(args.token)
-        filtered = [p for p in data if _position_matches_token(p, token_filter)]
-    else:
-        filtered = data
+    # 类型过滤与 token 过滤合并为一次遍历，总数顺带计数
+    token_filter = str(args.token) if args.token else None
+    total = 0
+    filtered: List[Dict[str, Any]] = []
+    for p in positions:
+        if not isinstance(p, dict):
+            continue
+        total += 1
+        if token_filter is None or _position_matches_token(p, token_filter):
+            filtered.append(p)
 
-    print(f"[INFO] 仓位总数：{len(data)}，筛选后：{len(filtered)}")
+    print(f"[INFO] 仓位总数：{total}，筛选后：{len(filtered)}")
 
     if args.raw:
-        print(json.dumps(filtered, indent=2, ensure_ascii=False))
+        print(_json_dumps(filtered))
         return 0
 
-    summary: Dict[str, Dict[str, Any]] = {}
-    for pos in filtered:
-        token_id = _extract_token_identifier(pos) or "?"
-        size = _extract_position_size_from_entry(pos) or 0.0
-        avg_price = _extract_avg_price_from_entry(pos)
-        market_title, outcome_label, status_text = _extract_market_metadata(pos)
-
-        entry = summary.setdefault(
-            token_id,
-            {"size": 0.0, "avg": None, "count": 0, "market": None, "outcome": None, "status": None},
-        )
+    fields = [_extract_position_fields(pos) for pos in filtered]
+
+    summary: Dict[str, Dict[str, Any]] = defaultdict(_new_summary_entry)
+    for token_id, size, avg_price, market_title, outcome_label, status_text in fields:
+        entry = summary[token_id]
         entry["size"] += size
         entry["count"] += 1
         if avg_price is not None:
@@ -197,7 +253,7 @@ def main() -> int:
 
     if summary:
         print("[SUMMARY] 按 token 汇总：")
-        for token_id in sorted(summary):
+        for token_id in sorted(summary, key=_token_sort_key):
             info = summary[token_id]
             avg_display = info["avg"]
             avg_text = f"{avg_display:.4f}" if avg_display is not None else "N/A"
@@ -217,12 +273,9 @@ def main() -> int:
 
     if args.verbose:
         print("[DETAIL] 仓位明细：")
-        for idx, pos in enumerate(filtered, start=1):
-            token_id = _extract_token_identifier(pos) or "?"
-            size = _extract_position_size_from_entry(pos) or 0.0
-            avg_price = _extract_avg_price_from_entry(pos)
+        for idx, (pos, pos_fields) in enumerate(zip(filtered, fields), start=1):
+            token_id, size, avg_price, market_title, outcome_label, status_text = pos_fields
             avg_text = f"{avg_price:.4f}" if avg_price is not None else "N/A"
-            market_title, outcome_label, status_text = _extract_market_metadata(pos)
             details = []
             if market_title:
                 details.append(f"market={market_title}")
@@ -232,7 +285,7 @@ def main() -> int:
                 details.append(f"status={status_text}")
             extra = f" ({', '.join(details)})" if details else ""
             print(f"[{idx}] token={token_id} size={size:.4f} avg_price={avg_text}{extra}")
-            print(json.dumps(pos, indent=2, ensure_ascii=False))
+            print(_json_dumps(pos))
 
     if args.token and not filtered:
         print(f"[WARN] 未找到 token={args.token} 的仓位记录。")
@@ -0,0 +1,130 @@
+"""Shared test setup for the POLYMARKET_MAKER suite.
+
+``Volatility_arbitrage_run`` imports ``requests`` and ``websocket`` at module
+import time, and test modules import it during collection, i.e. before any
+fixture runs. The stubs are therefore installed here, once, when pytest loads
+this conftest, rather than as a side effect of whichever test module happens to
+be collected first.
+
+It also hosts the stub clients shared by the test modules.
+"""
+
+import collections
+import sys
+import types
+from pathlib import Path
+from typing import Deque, Dict, List
+
+
+class _RequestException(Exception):
+    pass
+
+
+class _Timeout(_RequestException):
+    pass
+
+
+class _HTTPError(_RequestException):
+    pass
+
+
+def _default_get(*args, **kwargs):  # pragma: no cover - defensive stub
+    raise RuntimeError("requests stub should be patched in tests")
+
+
+requests_stub = types.SimpleNamespace(
+    RequestException=_RequestException,
+    Timeout=_Timeout,
+    HTTPError=_HTTPError,
+    get=_default_get,
+)
+
+sys.modules["requests"] = requests_stub
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+class _WebsocketStub(types.SimpleNamespace):
+    def WebSocketApp(self, *args, **kwargs):  # pragma: no cover - defensive stub
+        raise RuntimeError("websocket stub should not be used in tests")
+
+
+sys.modules["websocket"] = _WebsocketStub()
+
+
+class DummyResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):  # pragma: no cover - triggered only on errors
+        if self.status_code >= 400:
+            raise _HTTPError(f"status={self.status_code}")
+
+
+class StubAdapter:
+    def __init__(self, client):
+        self.client = client
+
+    def create_order(self, payload: Dict[str, float]) -> Dict[str, object]:
+        return self.client.create_order(payload)
+
+    def get_order_status(self, order_id: str) -> Dict[str, object]:
+        return self.client.get_order_status(order_id)
+
+
+class DummyClient:
+    def __init__(self, status_sequences: List[List[Dict[str, object]]]):
+        self._status_sequences: Deque[Deque[Dict[str, object]]] = collections.deque(
+            collections.deque(seq) for seq in status_sequences
+        )
+        self.order_status: Dict[str, Deque[Dict[str, object]]] = {}
+        self.created_orders: List[Dict[str, object]] = []
+        self.cancelled: List[str] = []
+        self._counter = 0
+
+    def create_order(self, payload: Dict[str, object]) -> Dict[str, object]:
+        self._counter += 1
+        order_id = f"order-{self._counter}"
+        status_seq = self._status_sequences.popleft() if self._status_sequences else collections.deque(
+            [{"status": "FILLED", "filledAmount": float(payload.get("size", 0.0)), "avgPrice": float(payload.get("price", 0.0))}]
+        )
+        self.order_status[order_id] = status_seq
+        self.created_orders.append({**payload, "order_id": order_id})
+        return {"orderId": order_id}
+
+    def get_order_status(self, order_id: str) -> Dict[str, object]:
+        # FIFO drain in O(1); the last status stays sticky for later polls.
+        seq = self.order_status[order_id]
+        return seq.popleft() if len(seq) > 1 else seq[0]
+
+    def cancel_order(self, order_id: str) -> None:
+        self.cancelled.append(order_id)
+        seq = self.order_status.get(order_id)
+        if seq is not None:
+            last = seq[-1] if seq else {"filledAmount": 0.0}
+            seq.append({"status": "CANCELLED", "filledAmount": last.get("filledAmount", 0.0)})
+
+
+class _Supplier:
+    """Replays ``values`` one per call, then keeps returning the last one."""
+
+    __slots__ = ("_dq", "_last")
+
+    def __init__(self, values: List[float]):
+        self._dq: Deque[float] = collections.deque(values)
+        self._last = values[-1] if values else None
+
+    def __call__(self):
+        if self._dq:
+            self._last = self._dq.popleft()
+        return self._last
+
+
+def _stream(values: List[float]) -> _Supplier:
+    return _Supplier(values)
@@ -1,10 +1,10 @@
-from collections import deque
 from pathlib import Path
 import sys
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from enum import Enum
+import threading
 
 import pytest
 
@@ -32,7 +32,7 @@ class MockAPI:
         self.create_calls = []
         self._templates = status_sequences or []
         self._sequences = []
-        self._last_status = []
+        self._cursors = []
         self._create_exceptions = create_exceptions or {}
 
     def create_order(self, payload):
@@ -44,20 +44,18 @@ class MockAPI:
                 raise exc_factory
             raise exc_factory()
         template = self._templates[len(self._sequences)] if len(self._sequences) < len(self._templates) else []
-        seq = deque(template)
-        self._sequences.append(seq)
-        last_status = template[-1] if template else {"status": "OPEN", "filledAmount": 0.0}
-        self._last_status.append(last_status)
+        self._sequences.append(tuple(template) or ({"status": "OPEN", "filledAmount": 0.0},))
+        self._cursors.append(0)
         return {"orderId": order_id}
 
     def get_order_status(self, order_id):
         idx = int(order_id)
         seq = self._sequences[idx]
-        if seq:
-            status = seq.popleft()
-            self._last_status[idx] = status
-            return status
-        return self._last_status[idx]
+        cursor = self._cursors[idx]
+        # stay on the last status once the scripted sequence is exhausted
+        if cursor < len(seq) - 1:
+            self._cursors[idx] = cursor + 1
+        return seq[cursor]
 
 
 def build_engine(config: ExecutionConfig, mock_api: MockAPI):
@@ -288,6 +286,54 @@ def test_slicing_rolls_residual_into_last_order():
     assert slices == pytest.approx([5.0, 6.0])
 
 
+def test_await_fill_polls_on_fixed_cadence():
+    config = ExecutionConfig(
+        order_slice_min=1.0,
+        order_slice_max=1.0,
+        retry_attempts=0,
+        wait_seconds=1.0,
+        poll_interval_seconds=0.4,
+        order_interval_seconds=0.0,
+    )
+    clock = FakeClock()
+    sleeps = []
+
+    class SlowStatusAPI(MockAPI):
+        def get_order_status(self, order_id):
+            clock.sleep(0.1)  # simulated status round-trip
+            return super().get_order_status(order_id)
+
+    def record_sleep(seconds):
+        sleeps.append(seconds)
+        clock.sleep(seconds)
+
+    engine = ExecutionEngine(SlowStatusAPI(), config, clock=clock.now, sleep=record_sleep)
+    result = engine.execute_sell("token", price=0.5, quantity=1.0)
+
+    assert result.status == "REJECTED"
+    assert result.message == "TIMEOUT"
+    # 0.1s of each 0.4s interval is spent waiting on the status call; the last
+    # sleep is trimmed so the final poll lands on the deadline.
+    assert sleeps == pytest.approx([0.3, 0.3, 0.1])
+
+
+def test_slicing_exact_multiples_keep_full_slices():
+    config = ExecutionConfig(
+        order_slice_min=1.7,
+        order_slice_max=1.7,
+        retry_attempts=0,
+        wait_seconds=1.0,
+        poll_interval_seconds=0.2,
+        order_interval_seconds=0.0,
+    )
+    engine, _ = build_engine(config, MockAPI())
+
+    # 13.6 is 8 * 1.7 but not exactly representable; it must still come out as
+    # eight slices rather than folding float noise into a merged final order.
+    slices = list(engine._slice_quantities(13.6, side="sell"))
+    assert slices == pytest.approx([1.7] * 8)
+
+
 def test_buy_returns_partial_when_later_slice_fails():
     config = ExecutionConfig(
         order_slice_min=1.0,
@@ -552,3 +598,67 @@ def test_clob_adapter_raises_when_response_contains_only_error(monkeypatch):
         adapter.create_order(payload)
 
     assert "not enough balance / allowance" in str(excinfo.value)
+
+
+def test_await_fill_prefers_pushed_status_and_wakes_on_event():
+    config = ExecutionConfig(
+        order_slice_min=1.0,
+        order_slice_max=1.0,
+        retry_attempts=0,
+        wait_seconds=30.0,
+        poll_interval_seconds=10.0,
+        order_interval_seconds=0.0,
+    )
+    pushed = {}
+    status_event = threading.Event()
+
+    class NoRestAPI(MockAPI):
+        def get_order_status(self, order_id):
+            raise AssertionError("REST status lookup should be skipped when a push is available")
+
+    def push_status(order_id):
+        # The first poll sees the order open; the fill arrives while waiting.
+        if order_id in pushed:
+            return pushed[order_id]
+        pushed[order_id] = {"status": "FILLED", "filledAmount": 1.0, "avgPrice": 0.5}
+        status_event.set()
+        return {"status": "OPEN", "filledAmount": 0.0}
+
+    engine = ExecutionEngine(
+        NoRestAPI(),
+        config,
+        order_status_fn=push_status,
+        status_event=status_event,
+    )
+    result = engine.execute_sell("token", price=0.5, quantity=1.0)
+
+    assert result.status == "FILLED"
+    assert result.avg_price == pytest.approx(0.5)
+    assert not status_event.is_set()
+
+
+def test_execute_skips_orders_without_book_liquidity():
+    config = ExecutionConfig(
+        order_slice_min=1.0,
+        order_slice_max=1.0,
+        retry_attempts=2,
+        order_interval_seconds=0.0,
+    )
+    books = {("dead", "buy"): 0.0, ("live", "buy"): 5.0}
+    filled = [{"status": "FILLED", "filledAmount": 1.0, "avgPrice": 0.5}]
+    api = MockAPI(status_sequences=[filled, filled])
+    engine = ExecutionEngine(
+        api,
+        config,
+        sleep=lambda _: None,
+        liquidity_fn=lambda token_id, side, price: books.get((token_id, side)),
+    )
+
+    skipped = engine.execute_buy("dead", price=0.5, quantity=1.0)
+    assert (skipped.status, skipped.message, skipped.attempts) == ("SKIPPED", "NO_LIQUIDITY", 0)
+    assert api.create_calls == []
+
+    assert engine.execute_buy("live", price=0.5, quantity=1.0).status == "FILLED"
+    # Unknown books fall through to normal submission.
+    assert engine.execute_buy("other", price=0.5, quantity=1.0).status == "FILLED"
+    assert len(api.create_calls) == 2
@@ -1,56 +1,9 @@
-import collections
-from typing import Deque, Dict, List
+from typing import Dict
 
 import pytest
 
 import maker_execution as maker
-
-
-class StubAdapter:
-    def __init__(self, client):
-        self.client = client
-
-    def create_order(self, payload: Dict[str, float]) -> Dict[str, object]:
-        return self.client.create_order(payload)
-
-    def get_order_status(self, order_id: str) -> Dict[str, object]:
-        return self.client.get_order_status(order_id)
-
-
-class DummyClient:
-    def __init__(self, status_sequences: List[List[Dict[str, object]]]):
-        self._status_sequences: Deque[Deque[Dict[str, object]]] = collections.deque(
-            collections.deque(seq) for seq in status_sequences
-        )
-        self.order_status: Dict[str, Deque[Dict[str, object]]] = {}
-        self.created_orders: List[Dict[str, object]] = []
-        self.cancelled: List[str] = []
-        self._counter = 0
-
-    def create_order(self, payload: Dict[str, object]) -> Dict[str, object]:
-        self._counter += 1
-        order_id = f"order-{self._counter}"
-        status_seq = self._status_sequences.popleft() if self._status_sequences else collections.deque(
-            [{"status": "FILLED", "filledAmount": float(payload.get("size", 0.0)), "avgPrice": float(payload.get("price", 0.0))}]
-        )
-        self.order_status[order_id] = status_seq
-        entry = dict(payload)
-        entry["order_id"] = order_id
-        self.created_orders.append(entry)
-        return {"orderId": order_id}
-
-    def get_order_status(self, order_id: str) -> Dict[str, object]:
-        seq = self.order_status[order_id]
-        if len(seq) > 1:
-            return seq.popleft()
-        return seq[0]
-
-    def cancel_order(self, order_id: str) -> None:
-        self.cancelled.append(order_id)
-        seq = self.order_status.get(order_id)
-        if seq is not None:
-            last = seq[-1] if seq else {"filledAmount": 0.0}
-            seq.append({"status": "CANCELLED", "filledAmount": last.get("filledAmount", 0.0)})
+from conftest import DummyClient, StubAdapter, _stream
 
 
 @pytest.fixture(autouse=True)
@@ -59,19 +12,6 @@ def _patch_adapter(monkeypatch):
     yield
 
 
-def _stream(values: List[float]):
-    dq = collections.deque(values)
-    last_val = values[-1] if values else None
-
-    def supplier():
-        nonlocal last_val
-        if dq:
-            last_val = dq.popleft()
-        return last_val
-
-    return supplier
-
-
 def test_maker_buy_immediate_fill():
     client = DummyClient(
         status_sequences=[[{"status": "FILLED", "filledAmount": 3.0, "avgPrice": 0.5}]]
@@ -86,9 +26,9 @@ def test_maker_buy_immediate_fill():
         sleep_fn=lambda _: None,
     )
 
-    assert result["status"] == "FILLED"
-    assert result["filled"] == pytest.approx(3.0)
-    assert result["avg_price"] == pytest.approx(0.5)
+    assert (result["status"], result["filled"], result["avg_price"]) == (
+        "FILLED", pytest.approx(3.0), pytest.approx(0.5)
+    )
     assert len(client.created_orders) == 1
 
 
@@ -135,8 +75,7 @@ def test_maker_buy_handles_missing_fill_amount_on_match():
         sleep_fn=lambda _: None,
     )
 
-    assert result["status"] == "FILLED"
-    assert result["filled"] == pytest.approx(5.0)
+    assert (result["status"], result["filled"]) == ("FILLED", pytest.approx(5.0))
     assert client.created_orders, "expected order to be created"
 
 
@@ -160,5 +99,237 @@ def test_maker_sell_waits_for_floor_before_order():
     assert len(client.created_orders) == 1
     order = client.created_orders[0]
     assert order["price"] >= 0.70
+    assert (result["status"], result["filled"]) == ("FILLED", pytest.approx(1.5))
+
+
+def test_maker_sell_aggressive_steps_down_after_timeout():
+    client = DummyClient(
+        status_sequences=[[{"status": "OPEN", "filledAmount": 0.0}]]
+    )
+
+    result = maker.maker_sell_follow_ask_with_floor_wait(
+        client,
+        token_id="asset",
+        position_size=2.0,
+        floor_X=0.5,
+        poll_sec=0.0,
+        min_order_size=0.0,
+        best_ask_fn=lambda: 0.7,
+        sleep_fn=lambda _: None,
+        sell_mode="aggressive",
+        aggressive_step=0.05,
+        aggressive_timeout=0.0,
+    )
+
+    prices = [order["price"] for order in client.created_orders]
+    assert prices == pytest.approx([0.7, 0.65])
+    assert client.cancelled[0] == "order-1"
+    assert result["status"] == "FILLED"
+
+
+def test_cancel_order_caches_nested_method_path():
+    class _Private:
+        def __init__(self):
+            self.cancelled = []
+
+        def cancel_order(self, order_id):
+            self.cancelled.append(order_id)
+
+    class _WrappedClient:
+        def __init__(self):
+            self.private = _Private()
+
+    first, second = _WrappedClient(), _WrappedClient()
+    assert maker._cancel_order(first, "order-1")
+    assert maker._CANCEL_METHOD_CACHE[_WrappedClient] == (("private",), "cancel_order")
+
+    assert maker._cancel_order(second, "order-2")
+    assert first.private.cancelled == ["order-1"]
+    assert second.private.cancelled == ["order-2"]
+
+
+def test_fetch_best_price_reuses_discovered_method():
+    class _BookClient:
+        def __init__(self):
+            self.calls = []
+
+        def get_order_book(self, *, token_id):
+            self.calls.append(token_id)
+            return {"bids": [{"price": "0.41"}], "asks": [{"price": "0.43"}]}
+
+    client = _BookClient()
+    assert maker._fetch_best_price(client, "tkn", "bid") == pytest.approx(0.41)
+    assert maker._BEST_PRICE_METHOD_CACHE[(_BookClient, "bid")] == ("get_order_book", "token_id")
+    assert maker._fetch_best_price(client, "tkn", "bid") == pytest.approx(0.41)
+    assert maker._fetch_best_price(client, "tkn", "ask") == pytest.approx(0.43)
+    assert client.calls == ["tkn", "tkn", "tkn"]
+
+
+def test_maker_buy_wakes_on_change_event():
+    client = DummyClient(
+        status_sequences=[[{"status": "FILLED", "filledAmount": 3.0, "avgPrice": 0.5}]]
+    )
+    change_event = maker.threading.Event()
+    change_event.set()
+    sleeps = []
+
+    result = maker.maker_buy_follow_bid(
+        client,
+        token_id="tkn",
+        target_size=3.0,
+        poll_sec=30.0,
+        min_order_size=0.0,
+        # The bid has moved a tick above the working order by the time the event fires.
+        best_bid_fn=_stream([0.5, 0.51]),
+        sleep_fn=sleeps.append,
+        change_event=change_event,
+    )
+
+    assert result["status"] == "FILLED"
+    assert not change_event.is_set()
+    # The early status poll still honours the minimum spacing, not the full poll_sec.
+    assert len(sleeps) == 1
+    assert 0.0 < sleeps[0] <= maker._MIN_STATUS_POLL_SEC
+
+
+def test_book_change_without_reprice_does_not_poll_status():
+    change_event = maker.threading.Event()
+    change_event.set()
+    polls = []
+
+    start = maker.time.monotonic()
+    maker._wait_next_status_poll(
+        change_event, 0.05, lambda: 0.5, lambda bid: bid >= 0.51, start, polls.append
+    )
+
+    # The wake only re-read the book: the wait ran out its poll interval.
+    assert maker.time.monotonic() - start >= 0.05
+    assert polls == []
+    assert not change_event.is_set()
+
+
+def test_maker_buy_prefers_pushed_order_status():
+    client = DummyClient(status_sequences=[[{"status": "OPEN", "filledAmount": 0.0}]])
+    pushed: Dict[str, Dict[str, object]] = {}
+
+    def _create_and_fill(payload):
+        response = DummyClient.create_order(client, payload)
+        pushed[response["orderId"]] = {"status": "FILLED", "filledAmount": 3.0, "avgPrice": 0.5}
+        return response
+
+    client.create_order = _create_and_fill
+
+    def _no_rest_status(order_id):
+        raise AssertionError("REST status lookup should be skipped when a push is available")
+
+    client.get_order_status = _no_rest_status
+
+    result = maker.maker_buy_follow_bid(
+        client,
+        token_id="tkn",
+        target_size=3.0,
+        poll_sec=0.0,
+        min_order_size=0.0,
+        best_bid_fn=lambda: 0.5,
+        sleep_fn=lambda _: None,
+        order_status_fn=pushed.get,
+    )
+
     assert result["status"] == "FILLED"
-    assert result["filled"] == pytest.approx(1.5)
+    assert result["filled"] == pytest.approx(3.0)
+
+
+def test_maker_logger_follows_host_logging_config():
+    import logging
+
+    import Volatility_arbitrage_run as runner
+
+    # Importing the maker must not decide levels or handlers for the host app.
+    assert maker.logger.level == logging.NOTSET
+    assert all(isinstance(h, logging.NullHandler) for h in maker.logger.handlers)
+
+    root = logging.getLogger()
+    saved = [
+        (target, list(target.handlers), target.level, target.propagate)
+        for target in (root, runner.logger, maker.logger)
+    ]
+    try:
+        root.handlers = []
+        root.setLevel(logging.WARNING)
+        assert not maker.logger.isEnabledFor(logging.INFO)
+
+        runner._ensure_console_logging()
+
+        assert maker.logger.isEnabledFor(logging.INFO)
+        console = [h for h in runner.logger.handlers if type(h) is logging.StreamHandler]
+        assert console and [h for h in maker.logger.handlers if h in console] == console
+    finally:
+        for target, handlers, level, propagate in saved:
+            target.handlers = handlers
+            target.setLevel(level)
+            target.propagate = propagate
+
+
+def test_each_repost_gets_its_own_payload():
+    client = DummyClient(
+        status_sequences=[
+            [{"status": "OPEN", "filledAmount": 0.0}],
+            [{"status": "FILLED", "filledAmount": 2.0, "avgPrice": 0.52}],
+        ]
+    )
+    seen = []
+
+    def _keep_payload(payload):
+        seen.append(payload)
+        return DummyClient.create_order(client, payload)
+
+    client.create_order = _keep_payload
+
+    maker.maker_buy_follow_bid(
+        client,
+        token_id="asset",
+        target_size=2.0,
+        poll_sec=0.0,
+        min_order_size=0.0,
+        best_bid_fn=_stream([0.50, 0.52, 0.52]),
+        sleep_fn=lambda _: None,
+    )
+
+    assert len(seen) == 2
+    assert seen[0] is not seen[1]
+    assert [payload["price"] for payload in seen] == pytest.approx([0.50, 0.52])
+
+
+@pytest.mark.parametrize(
+    "ask_after, reprices",
+    [
+        pytest.param(0.7198, True, id="two_ticks_below"),
+        pytest.param(0.7199, False, id="exactly_one_tick_below"),
+    ],
+)
+def test_sell_reprice_threshold_boundary(ask_after, reprices):
+    client = DummyClient(
+        status_sequences=[
+            [
+                {"status": "OPEN", "filledAmount": 0.0},
+                {"status": "FILLED", "filledAmount": 1.0, "avgPrice": 0.72},
+            ]
+        ]
+    )
+
+    result = maker.maker_sell_follow_ask_with_floor_wait(
+        client,
+        token_id="asset",
+        position_size=1.0,
+        floor_X=0.5,
+        poll_sec=0.0,
+        min_order_size=0.0,
+        best_ask_fn=_stream([0.72, ask_after]),
+        sleep_fn=lambda _: None,
+    )
+
+    assert result["status"] == "FILLED"
+    # A re-quote shows up as a second order posted at the lower ask.
+    assert [order["price"] for order in client.created_orders] == pytest.approx(
+        [0.72, ask_after] if reprices else [0.72]
+    )
@@ -1,47 +1,7 @@
-import sys
 import types
-from pathlib import Path
-
-import pytest
-
-
-class _RequestException(Exception):
-    pass
-
-
-class _Timeout(_RequestException):
-    pass
-
-
-class _HTTPError(_RequestException):
-    pass
-
-
-def _default_get(*args, **kwargs):  # pragma: no cover - defensive stub
-    raise RuntimeError("requests stub should be patched in tests")
-
-
-requests_stub = types.SimpleNamespace(
-    RequestException=_RequestException,
-    Timeout=_Timeout,
-    HTTPError=_HTTPError,
-    get=_default_get,
-)
-
-sys.modules["requests"] = requests_stub
-
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-
-class _WebsocketStub(types.SimpleNamespace):
-    def WebSocketApp(self, *args, **kwargs):  # pragma: no cover - defensive stub
-        raise RuntimeError("websocket stub should not be used in tests")
-
-
-sys.modules["websocket"] = _WebsocketStub()
 
+import Volatility_arbitrage_run as _var
+from conftest import DummyResponse
 from Volatility_arbitrage_run import (
     _extract_positions_from_data_api_response,
     _fetch_positions_from_data_api,
@@ -49,23 +9,14 @@ from Volatility_arbitrage_run import (
 )
 
 
-class DummyResponse:
-    def __init__(self, status_code, payload):
-        self.status_code = status_code
-        self._payload = payload
-
-    def json(self):
-        return self._payload
-
-    def raise_for_status(self):  # pragma: no cover - triggered only on errors
-        if self.status_code >= 400:
-            raise _HTTPError(f"status={self.status_code}")
-
-
 class DummyClient(types.SimpleNamespace):
     pass
 
 
+# A full 500-entry page, built once; the fetcher only reads the entries.
+_FIRST_PAGE = tuple({"asset": asset, "size": "1"} for asset in map(str, range(500)))
+
+
 def test_extract_positions_handles_various_shapes():
     assert _extract_positions_from_data_api_response(None) == []
     sample_list = [{"asset": "1"}]
@@ -73,12 +24,13 @@ def test_extract_positions_handles_various_shapes():
     sample_dict = {"data": [{"asset": "2"}]}
     assert _extract_positions_from_data_api_response(sample_dict) == [{"asset": "2"}]
     assert _extract_positions_from_data_api_response({"unexpected": []}) is None
+    assert _extract_positions_from_data_api_response(({"asset": "3"},)) is None
 
 
 def test_fetch_positions_aggregates_pages(monkeypatch):
-    module = __import__("Volatility_arbitrage_run")
+    module = _var
 
-    first_page = [{"asset": str(i), "size": "1"} for i in range(500)]
+    first_page = list(_FIRST_PAGE)
     second_page = [{"asset": "500", "size": "2"}]
     responses = [
         DummyResponse(200, {"data": first_page, "meta": {"total": 501}}),
@@ -103,7 +55,7 @@ def test_fetch_positions_aggregates_pages(monkeypatch):
 
 
 def test_fetch_positions_reports_404(monkeypatch):
-    module = __import__("Volatility_arbitrage_run")
+    module = _var
 
     responses = [
         DummyResponse(404, {}),
@@ -136,7 +88,7 @@ def test_fetch_positions_missing_address(monkeypatch):
 
 
 def test_fetch_positions_handles_http_error(monkeypatch):
-    module = __import__("Volatility_arbitrage_run")
+    module = _var
 
     def fake_get(url, params=None, timeout=None):  # pragma: no cover - simple stub
         raise module.requests.Timeout("boom")
@@ -151,7 +103,7 @@ def test_fetch_positions_handles_http_error(monkeypatch):
 
 
 def test_fetch_positions_env_fallback(monkeypatch):
-    module = __import__("Volatility_arbitrage_run")
+    module = _var
 
     calls = []
 
@@ -171,7 +123,7 @@ def test_fetch_positions_env_fallback(monkeypatch):
 
 
 def test_lookup_position_avg_price_success(monkeypatch):
-    module = __import__("Volatility_arbitrage_run")
+    module = _var
 
     sample_positions = [
         {"asset": "123", "avg_price": "0.925", "size": "5"},
@@ -190,7 +142,7 @@ def test_lookup_position_avg_price_success(monkeypatch):
 
 
 def test_lookup_position_avg_price_not_found(monkeypatch):
-    module = __import__("Volatility_arbitrage_run")
+    module = _var
 
     sample_positions = [{"tokenId": "999", "avg_price": "0.8", "size": "3"}]
 
@@ -43,3 +43,15 @@ def test_strategy_with_total_position_is_detected() -> None:
 
     strategy.on_buy_filled(**kwargs)
     assert strategy.calls == [(0.66, 10.0, 10.0)]
+
+
+def test_total_position_support_is_cached_per_class() -> None:
+    old_strategy, new_strategy = _OldStrategy(), _NewStrategy()
+    for _ in range(2):
+        assert not _strategy_accepts_total_position(old_strategy)
+        assert _strategy_accepts_total_position(new_strategy)
+
+    patched = _OldStrategy()
+    patched.on_buy_filled = lambda avg_price, size=None, total_position=None: None
+    assert _strategy_accepts_total_position(patched)
+    assert not _strategy_accepts_total_position(_OldStrategy())
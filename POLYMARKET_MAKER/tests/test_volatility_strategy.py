@@ -0,0 +1,76 @@
+"""Behavioural tests for the drop-window bookkeeping in ``VolArbStrategy``."""
+
+import random
+
+from Volatility_arbitrage_strategy import ActionType, StrategyConfig, VolArbStrategy
+
+
+def _make_strategy(**overrides) -> VolArbStrategy:
+    params = {"token_id": "T", "drop_window_minutes": 1.0, "drop_pct": 0.1}
+    params.update(overrides)
+    return VolArbStrategy(StrategyConfig(**params))
+
+
+def test_window_high_matches_full_rescan() -> None:
+    rng = random.Random(7)
+    strategy = _make_strategy(max_history_points=25)
+    mids = []
+    ts = 0.0
+    for _ in range(500):
+        ts += rng.choice((0.5, 1.0, 5.0, 30.0))
+        mid = round(rng.uniform(0.2, 0.8), 3)
+        strategy.on_tick(best_ask=mid, best_bid=mid, ts=ts)
+        mids.append((ts, mid))
+        live = [px for t, px in mids if ts - t <= 60.0][-25:]
+        stats = strategy.status()
+        assert stats["price_history_len"] == len(live)
+        assert stats["drop_stats"]["window_high"] == max(live)
+        assert stats["drop_stats"]["window_low"] == min(live)
+
+
+def test_drop_from_window_high_triggers_buy() -> None:
+    strategy = _make_strategy()
+    assert strategy.on_tick(best_ask=0.61, best_bid=0.59, ts=1.0) is None
+    action = strategy.on_tick(best_ask=0.51, best_bid=0.49, ts=2.0)
+    assert action is not None and action.action == ActionType.BUY
+    assert action.extra["drop_triggered"] is True
+    assert action.extra["window_high"] == 0.6
+
+    # 高点滑出窗口后，相对新高点的跌幅不足，不再触发
+    strategy.on_reject()
+    assert strategy.on_tick(best_ask=0.51, best_bid=0.49, ts=100.0) is None
+    assert strategy.status()["drop_stats"]["window_high"] == 0.5
+
+
+def test_price_band_rejects_out_of_range_ticks() -> None:
+    strategy = _make_strategy(min_price=0.1, max_price=0.9, buy_price_threshold=0.5)
+    assert strategy.on_tick(best_ask=0.95, best_bid=0.4, ts=1.0) is None
+    assert strategy.on_tick(best_ask=0.4, best_bid=0.05, ts=2.0) is None
+    assert strategy.status()["price_history_len"] == 0
+
+    action = strategy.on_tick(best_ask=0.4, best_bid=0.38, ts=3.0)
+    assert action is not None and action.action == ActionType.BUY
+
+
+def test_runtime_switches_gate_signals() -> None:
+    strategy = _make_strategy(buy_price_threshold=0.5)
+    strategy.stop("manual")
+    assert strategy.on_tick(best_ask=0.4, best_bid=0.38, ts=1.0) is None
+    strategy.resume()
+    strategy.enable_sell_only("countdown")
+    assert strategy.on_tick(best_ask=0.4, best_bid=0.38, ts=2.0) is None
+    strategy.disable_sell_only()
+    assert strategy.on_tick(best_ask=0.4, best_bid=0.38, ts=3.0).action == ActionType.BUY
+
+    strategy.on_buy_filled(0.4, 10.0)
+    strategy.enable_sell_only("countdown")
+    sell = strategy.on_tick(best_ask=0.46, best_bid=0.45, ts=4.0)
+    assert sell is not None and sell.action == ActionType.SELL
+
+
+def test_disabled_sell_signals_never_emit_sell() -> None:
+    strategy = _make_strategy(buy_price_threshold=0.5, disable_sell_signals=True)
+    strategy.on_buy_filled(0.4, 10.0)
+    assert strategy.on_tick(best_ask=0.9, best_bid=0.85, ts=1.0) is None
+    strategy.enable_sell_only("countdown")
+    assert strategy.on_tick(best_ask=0.9, best_bid=0.85, ts=2.0) is None
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import math
+import sys
+import threading
 import time
-from collections import deque
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, is_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 try:  # pragma: no cover - optional dependency
     import yaml
@@ -17,6 +19,78 @@ except ImportError:  # pragma: no cover - fallback to lightweight parser
 
 Number = float
 
+# 10 ** n lookup for size rounding. Dividing (rather than multiplying by a
+# precomputed inverse) keeps results identical to the original arithmetic.
+_POW10: Tuple[float, ...] = tuple(10.0 ** n for n in range(10))
+
+# Sentinel for "key absent" lookups in the status poll loop.
+_MISSING = object()
+
+# Order states after which ``_await_fill`` stops polling.
+_FINAL_ORDER_STATUSES = frozenset(
+    {"FILLED", "CANCELLED", "CANCELED", "MATCHED", "COMPLETED", "EXECUTED"}
+)
+# States that imply a full fill even when the payload reports no amount.
+_FILLED_ORDER_STATUSES = frozenset({"FILLED", "MATCHED", "COMPLETED", "EXECUTED"})
+
+# Key probes for order status payloads, in priority order.
+_AVG_PRICE_KEYS = (
+    "avgPrice",
+    "averagePrice",
+    "avg_price",
+    "filledAvgPrice",
+    "filledAveragePrice",
+    "executionPrice",
+    "averageExecutionPrice",
+    "fillPrice",
+    "matchedPrice",
+    "price",
+)
+_PRICE_KEYS = _AVG_PRICE_KEYS + ("lastPrice", "lastTradePrice", "markPrice")
+# Presence of any of these marks a dict as the status payload.
+_PAYLOAD_FILLED_KEYS = (
+    "filledAmount",
+    "filled",
+    "filledQuantity",
+    "filledSize",
+    "filledAmountQuote",
+    "filled_amount",
+    "totalFilled",
+)
+_FILLED_KEYS = _PAYLOAD_FILLED_KEYS + ("matchedShares", "shares", "baseAmount")
+_NESTED_PAYLOAD_KEYS = ("data", "order", "result", "response", "value", "payload")
+_FILL_SIZE_KEYS = (
+    "size",
+    "quantity",
+    "qty",
+    "amount",
+    "filledAmount",
+    "filled",
+    "filledQuantity",
+    "filledSize",
+    "matchedShares",
+    "shares",
+    "baseAmount",
+    "takingAmount",
+    "takerAmount",
+    "taker_amount",
+)
+_FALLBACK_FILLED_KEYS = (
+    "takingAmount",
+    "takerAmount",
+    "taker_amount",
+    "size",
+    "quantity",
+    "qty",
+    "matchedShares",
+    "shares",
+    "baseAmount",
+)
+
+
+def _to_ns(seconds: float) -> int:
+    return round(seconds * 1e9)
+
 
 @dataclass
 class ExecutionConfig:
@@ -92,8 +166,24 @@ class ExecutionConfig:
             raise ValueError("min_market_order_size must be >= 0")
 
 
+# Copied per slice; the variable fields are listed so the key order is unchanged.
+_ORDER_PAYLOAD_TEMPLATE: Dict[str, object] = {
+    "tokenId": None,
+    "side": None,
+    "price": None,
+    "size": None,
+    "type": "GTC",
+    "timeInForce": "GTC",
+    "allowPartial": True,
+}
+
+
 @dataclass
 class OrderRequest:
+    # Built once per slice; explicit slots (rather than ``slots=True``) keep
+    # the class importable on Python < 3.10.
+    __slots__ = ("token_id", "side", "price", "size")
+
     token_id: str
     side: str
     price: float
@@ -128,11 +218,29 @@ class ExecutionEngine:
         config: ExecutionConfig,
         clock: Optional[Callable[[], float]] = None,
         sleep: Optional[Callable[[float], None]] = None,
+        clock_ns: Optional[Callable[[], int]] = None,
+        order_status_fn: Optional[Callable[[str], Optional[Dict[str, object]]]] = None,
+        status_event: Optional[threading.Event] = None,
+        liquidity_fn: Optional[Callable[[str, str, float], Optional[float]]] = None,
     ) -> None:
         self.api = api_client
         self.config = config
         self._clock = clock or time.monotonic
         self._sleep = sleep or time.sleep
+        # Integer-nanosecond clock for the fill deadline; a custom float clock is
+        # scaled so injected test clocks keep driving the poll loop.
+        if clock_ns is None:
+            clock_ns = time.monotonic_ns if clock is None else lambda: _to_ns(clock())
+        self._clock_ns = clock_ns
+        # Optional push feed (e.g. the user websocket channel): ``order_status_fn``
+        # answers a poll without a REST call when it has the order, and setting
+        # ``status_event`` cuts the wait before the next poll short.
+        self._order_status_fn = order_status_fn
+        self._status_event = status_event
+        # Optional book snapshot lookup: ``liquidity_fn(token_id, side, price)``
+        # returns the resting size our order could match at ``price`` (None when
+        # unknown), letting dead books skip the submit/retry cycle entirely.
+        self._liquidity_fn = liquidity_fn
 
     def execute_sell(
         self,
@@ -172,6 +280,19 @@ class ExecutionEngine:
                 limit_price=float(price),
             )
 
+        if not self._is_fillable(token_id, side, price):
+            return ExecutionResult(
+                side=side,
+                requested=float(quantity),
+                filled=0.0,
+                last_price=float(price),
+                attempts=0,
+                status="SKIPPED",
+                message="NO_LIQUIDITY",
+                avg_price=None,
+                limit_price=float(price),
+            )
+
         remaining = quantity
         filled_total = 0.0
         current_price = price
@@ -187,12 +308,13 @@ class ExecutionEngine:
 
         while remaining > 1e-9 and attempt < max_attempts:
             attempt += 1
-            slice_queue: Deque[float] = deque(
-                self._slice_quantities(remaining, side=side, price=current_price)
-            )
+            slices = list(self._slice_quantities(remaining, side=side, price=current_price))
+            slice_count = len(slices)
+            slice_idx = 0
 
-            while slice_queue and remaining > 1e-9:
-                slice_size = slice_queue.popleft()
+            while slice_idx < slice_count and remaining > 1e-9:
+                slice_size = slices[slice_idx]
+                slice_idx += 1
                 order_price = current_price
                 last_submitted_price = order_price
                 try:
@@ -212,7 +334,6 @@ class ExecutionEngine:
                     if filled_total > 1e-9:
                         remaining = max(quantity - filled_total, 0.0)
                         aborted_due_to_error = True
-                        slice_queue.clear()
                         break
                     raise
                 filled = min(filled, slice_size)
@@ -228,7 +349,7 @@ class ExecutionEngine:
                     # keep the unfinished part for the next attempt
                     break
 
-                if slice_queue and self.config.order_interval_seconds:
+                if slice_idx < slice_count and self.config.order_interval_seconds:
                     self._sleep(self.config.order_interval_seconds)
 
             if aborted_due_to_error:
@@ -281,15 +402,11 @@ class ExecutionEngine:
         return price * (1 + step)
 
     def _create_order(self, order: OrderRequest) -> str:
-        payload: Dict[str, object] = {
-            "tokenId": order.token_id,
-            "side": order.side,
-            "price": order.price,
-            "size": order.size,
-            "type": "GTC",
-            "timeInForce": "GTC",
-            "allowPartial": True,
-        }
+        payload = _ORDER_PAYLOAD_TEMPLATE.copy()
+        payload["tokenId"] = order.token_id
+        payload["side"] = order.side
+        payload["price"] = order.price
+        payload["size"] = order.size
         response = self.api.create_order(payload)
         if "orderId" not in response:
             raise RuntimeError("Polymarket API did not return orderId")
@@ -298,40 +415,38 @@ class ExecutionEngine:
     def _await_fill(
         self, order_id: str, target_size: float
     ) -> Tuple[float, str, Optional[float]]:
-        deadline = self._clock() + self.config.wait_seconds
+        poll_interval_ns = _to_ns(self.config.poll_interval_seconds)
+        next_poll = self._clock_ns()
+        deadline = next_poll + _to_ns(self.config.wait_seconds)
         filled = 0.0
         last_status = "OPEN"
+        last_status_raw: Optional[str] = None
+        status_upper = ""
         last_avg_price: Optional[float] = None
-        final_statuses: Set[str] = {"FILLED", "CANCELLED", "CANCELED", "MATCHED", "COMPLETED", "EXECUTED"}
 
         while True:
-            status = self.api.get_order_status(order_id)
+            status = self._pushed_status(order_id)
+            if status is None:
+                status = self.api.get_order_status(order_id)
             if not isinstance(status, dict):
                 raise RuntimeError(
                     f"Order status response must be a mapping, got: {status!r}"
                 )
-
-            if "status" not in status:
+            # One lookup both validates and reads the state; the error message
+            # is only formatted on the failure path.
+            raw_status = status.get("status", _MISSING)
+            if raw_status is _MISSING:
                 raise RuntimeError(
                     f"Order status payload missing 'status': {status!r}"
                 )
 
-            filled = float(status.get("filledAmount", filled))
-            status_text = str(status.get("status", last_status))
+            filled_amount = status.get("filledAmount")
+            if filled_amount is not None:
+                filled = float(filled_amount)
+            status_text = raw_status if type(raw_status) is str else str(raw_status)
             last_status = status_text
             avg_candidate: Optional[float] = None
-            for key in (
-                "avgPrice",
-                "averagePrice",
-                "avg_price",
-                "filledAvgPrice",
-                "filledAveragePrice",
-                "executionPrice",
-                "averageExecutionPrice",
-                "fillPrice",
-                "matchedPrice",
-                "price",
-            ):
+            for key in _AVG_PRICE_KEYS:
                 candidate = status.get(key)
                 if candidate is None:
                     continue
@@ -346,19 +461,55 @@ class ExecutionEngine:
             if filled >= target_size - 1e-9:
                 break
 
-            status_upper = status_text.upper()
+            # Consecutive polls usually report the same state; only re-fold
+            # the case when the text actually changes.
+            if status_text != last_status_raw:
+                last_status_raw = status_text
+                status_upper = status_text.upper()
 
-            if status_upper in final_statuses:
+            if status_upper in _FINAL_ORDER_STATUSES:
                 if status_upper == "MATCHED" and filled < target_size - 1e-9:
                     filled = target_size
                 break
 
-            if self._clock() >= deadline:
+            now = self._clock_ns()
+            if now >= deadline:
                 last_status = "TIMEOUT"
                 break
-            self._sleep(self.config.poll_interval_seconds)
+            # Poll on a fixed cadence: the status round-trip counts against the
+            # interval instead of being added to it, and never sleep past the deadline.
+            next_poll = max(next_poll + poll_interval_ns, now)
+            delay = min(next_poll, deadline) - now
+            if delay > 0:
+                if self._status_event is not None:
+                    # Only consume a push that actually woke us, and do it
+                    # before the status is re-read so a later push is not lost.
+                    if self._status_event.wait(delay / 1e9):
+                        self._status_event.clear()
+                else:
+                    self._sleep(delay / 1e9)
         return min(filled, target_size), last_status, last_avg_price
 
+    def _is_fillable(self, token_id: str, side: str, price: float) -> bool:
+        if self._liquidity_fn is None:
+            return True
+        try:
+            available = self._liquidity_fn(token_id, side, price)
+        except Exception:
+            return True
+        if available is None:
+            return True
+        market_min = getattr(self.config, "min_market_order_size", 0.0) or 0.0
+        return float(available) > market_min
+
+    def _pushed_status(self, order_id: str) -> Optional[Dict[str, object]]:
+        if self._order_status_fn is None:
+            return None
+        try:
+            return self._order_status_fn(order_id)
+        except Exception:
+            return None
+
     def _slice_quantities(
         self, total: float, side: Optional[str] = None, price: Optional[float] = None
     ) -> Iterable[float]:
@@ -404,23 +555,40 @@ class ExecutionEngine:
         return slices
 
     def _minimum_buy_size(self, price: float) -> float:
-        min_quote = getattr(self.config, "min_quote_amount", 0.0) or 0.0
-        market_min = getattr(self.config, "min_market_order_size", 0.0) or 0.0
-        if market_min > 0:
-            market_min = self._ceil_precision(market_min)
-        base_min = max(self.config.order_slice_min, market_min)
-        if price <= 0:
-            return base_min
-        if min_quote <= 0:
-            return base_min
-        quote_min = self._ceil_precision(min_quote / price)
-        return max(base_min, quote_min)
+        # The config is a mutable dataclass, so the cache is keyed on its values.
+        return _minimum_buy_size_cached(
+            price,
+            getattr(self.config, "min_quote_amount", 0.0) or 0.0,
+            getattr(self.config, "min_market_order_size", 0.0) or 0.0,
+            self.config.order_slice_min,
+        )
 
     @staticmethod
     def _ceil_precision(value: float, decimals: int = 4) -> float:
-        factor = 10 ** decimals
-        scaled = value * factor
-        return math.ceil(scaled - 1e-12) / factor
+        return _ceil_precision_cached(value, decimals)
+
+
+# Slicing re-derives the same minimums for every attempt at a handful of prices.
+@lru_cache(maxsize=1024)
+def _ceil_precision_cached(value: float, decimals: int = 4) -> float:
+    factor = _POW10[decimals] if 0 <= decimals < len(_POW10) else 10 ** decimals
+    scaled = value * factor
+    return math.ceil(scaled - 1e-12) / factor
+
+
+@lru_cache(maxsize=1024)
+def _minimum_buy_size_cached(
+    price: float, min_quote: float, market_min: float, slice_min: float
+) -> float:
+    if market_min > 0:
+        market_min = _ceil_precision_cached(market_min)
+    base_min = max(slice_min, market_min)
+    if price <= 0:
+        return base_min
+    if min_quote <= 0:
+        return base_min
+    quote_min = _ceil_precision_cached(min_quote / price)
+    return max(base_min, quote_min)
 
 
 class PolymarketAPI:
@@ -433,6 +601,56 @@ class PolymarketAPI:
         raise NotImplementedError
 
 
+_ORDER_TYPE_ALIASES = {
+    "IOC": "FAK",  # py_clob_client historically uses FAK to emulate IOC behaviour
+}
+# (OrderType class, requested type) -> resolved member; the class object is
+# held in the key so a reloaded py_clob_client gets fresh entries.
+_ORDER_TYPE_CACHE: Dict[Tuple[object, str], object] = {}
+
+
+_ORDER_ID_KEYS = (
+    "order_id",
+    "orderId",
+    "orderID",
+    "id",
+    "orderHash",
+    "order_hash",
+    "hash",
+)
+
+
+def _first_id_candidate(lookup: Callable[[str], object]) -> Optional[str]:
+    """Return the first non-empty order id field, stringified, or ``None``."""
+
+    for key in _ORDER_ID_KEYS:
+        cand = lookup(key)
+        if cand not in (None, ""):
+            return str(cand)
+    return None
+
+
+def _object_mapping(obj: object) -> Optional[object]:
+    """Expose a response object's fields as a mapping for the order id walker."""
+
+    try:
+        if is_dataclass(obj):
+            return asdict(obj)
+    except Exception:
+        pass
+
+    to_dict = getattr(obj, "_asdict", None)
+    if callable(to_dict):
+        try:
+            return to_dict()
+        except Exception:
+            pass
+
+    if hasattr(obj, "__dict__"):
+        return vars(obj)
+    return None
+
+
 class ClobPolymarketAPI(PolymarketAPI):
     """Adapter that bridges :class:`py_clob_client.client.ClobClient` to ``PolymarketAPI``."""
 
@@ -475,6 +693,9 @@ class ClobPolymarketAPI(PolymarketAPI):
                 raise RuntimeError(
                     f"Order response missing order id: {raw_response!r}"
                 )
+        # Interned so every caller keys its bookkeeping on the same string object;
+        # consumers should pass ``orderId`` through rather than rebuilding it.
+        order_id = sys.intern(order_id)
 
         if isinstance(raw_response, dict):
             response = dict(raw_response)
@@ -490,22 +711,26 @@ class ClobPolymarketAPI(PolymarketAPI):
             or "GTC"
         ).upper()
 
-        aliases = {
-            "IOC": "FAK",  # py_clob_client historically uses FAK to emulate IOC behaviour
-        }
+        cache_key = (order_type_cls, desired)
+        cached = _ORDER_TYPE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
 
-        candidates = [desired, aliases.get(desired), "GTC", "FAK"]
-        for cand in candidates:
+        resolved: object = None
+        for cand in (desired, _ORDER_TYPE_ALIASES.get(desired), "GTC", "FAK"):
             if not cand:
                 continue
-            member = getattr(order_type_cls, cand, None)
-            if member is not None:
-                return member
-        # Fallback to the first enum entry to avoid crashing; actual value will be overwritten by metadata
-        try:
-            return next(iter(order_type_cls))
-        except Exception:  # pragma: no cover - defensive
-            return desired
+            resolved = getattr(order_type_cls, cand, None)
+            if resolved is not None:
+                break
+        else:
+            # Fallback to the first enum entry to avoid crashing; actual value will be overwritten by metadata
+            try:
+                resolved = next(iter(order_type_cls))
+            except Exception:  # pragma: no cover - defensive
+                resolved = desired
+        _ORDER_TYPE_CACHE[cache_key] = resolved
+        return resolved
 
     @staticmethod
     def _apply_order_metadata(order, order_type, payload: Dict[str, object]) -> None:
@@ -580,139 +805,84 @@ class ClobPolymarketAPI(PolymarketAPI):
 
     @staticmethod
     def _extract_order_id(response: object) -> Optional[str]:
-        candidates = (
-            "order_id",
-            "orderId",
-            "orderID",
-            "id",
-            "orderHash",
-            "order_hash",
-            "hash",
-        )
-
-        visited: set[int] = set()
-
-        def walk(obj: object, allow_plain_string: bool = False) -> Optional[str]:
-            if obj is None:
-                return None
-
-            if isinstance(obj, (str, bytes, bytearray)):
-                if not allow_plain_string:
-                    return None
-                text = obj.decode() if isinstance(obj, (bytes, bytearray)) else obj
-                text = text.strip()
-                return text or None
+        if isinstance(response, (str, bytes, bytearray)):
+            text = response.decode() if isinstance(response, (bytes, bytearray)) else response
+            return text.strip() or None
+
+        # Depth-first walk on an explicit stack; children are pushed in reverse so
+        # they are visited in the same order as the former recursive walker.
+        # ``visited`` keeps the objects alive so temporary dicts cannot recycle ids.
+        visited: Dict[int, object] = {}
+        stack: List[object] = [response]
+        while stack:
+            obj = stack.pop()
+            if obj is None or isinstance(obj, (str, bytes, bytearray)):
+                continue
 
             obj_id = id(obj)
             if obj_id in visited:
-                return None
-            visited.add(obj_id)
+                continue
+            visited[obj_id] = obj
 
             if isinstance(obj, dict):
-                for key in candidates:
-                    cand = obj.get(key)
-                    if cand not in (None, ""):
-                        return str(cand)
-                for value in obj.values():
-                    found = walk(value, allow_plain_string=False)
-                    if found:
-                        return found
-                return None
-
-            if isinstance(obj, (list, tuple, set)):
-                for item in obj:
-                    found = walk(item, allow_plain_string=False)
-                    if found:
-                        return found
-                return None
-
-            for key in candidates:
-                try:
-                    cand = getattr(obj, key)
-                except AttributeError:
+                cand = _first_id_candidate(obj.get)
+                if cand is not None:
+                    if cand:
+                        return cand
                     continue
-                if cand not in (None, ""):
-                    return str(cand)
-
-            try:
-                from dataclasses import asdict, is_dataclass
-
-                if is_dataclass(obj):
-                    return walk(asdict(obj), allow_plain_string=False)
-            except Exception:
-                pass
+                stack.extend(reversed(list(obj.values())))
+                continue
 
-            to_dict = getattr(obj, "_asdict", None)
-            if callable(to_dict):
-                try:
-                    return walk(to_dict(), allow_plain_string=False)
-                except Exception:
-                    pass
+            if isinstance(obj, (list, tuple, set)):
+                stack.extend(reversed(list(obj)))
+                continue
 
-            if hasattr(obj, "__dict__"):
-                return walk(vars(obj), allow_plain_string=False)
+            cand = _first_id_candidate(lambda key: getattr(obj, key, None))
+            if cand is not None:
+                if cand:
+                    return cand
+                continue
 
-            return None
+            child = _object_mapping(obj)
+            if child is not None:
+                stack.append(child)
 
-        return walk(response, allow_plain_string=True)
+        return None
 
     @staticmethod
     def _normalize_status(raw: object) -> Dict[str, object]:
-        def locate_payload(obj: object, visited: Set[int]) -> Optional[Dict[str, object]]:
-            if obj is None:
-                return None
-
-            obj_id = id(obj)
-            if obj_id in visited:
-                return None
-            visited.add(obj_id)
+        def locate_payload(root: object) -> Optional[Dict[str, object]]:
+            # Depth-first on an explicit stack: well-known wrapper keys first,
+            # then every value, matching the former recursive search order.
+            visited: Set[int] = set()
+            stack: List[object] = [root]
+            while stack:
+                obj = stack.pop()
+                if obj is None:
+                    continue
 
-            if isinstance(obj, dict):
-                status = obj.get("status") or obj.get("state") or obj.get("orderStatus")
-                filled_keys = (
-                    "filledAmount",
-                    "filled",
-                    "filledQuantity",
-                    "filledSize",
-                    "filledAmountQuote",
-                    "filled_amount",
-                    "totalFilled",
-                )
-                has_filled = any(key in obj for key in filled_keys) or isinstance(
-                    obj.get("fills"), (list, tuple)
-                )
+                obj_id = id(obj)
+                if obj_id in visited:
+                    continue
+                visited.add(obj_id)
 
-                if status is not None or has_filled:
-                    return obj
+                if isinstance(obj, dict):
+                    status = obj.get("status") or obj.get("state") or obj.get("orderStatus")
+                    has_filled = any(key in obj for key in _PAYLOAD_FILLED_KEYS) or isinstance(
+                        obj.get("fills"), (list, tuple)
+                    )
 
-                nested_keys = (
-                    "data",
-                    "order",
-                    "result",
-                    "response",
-                    "value",
-                    "payload",
-                )
-                for key in nested_keys:
-                    if key in obj:
-                        payload = locate_payload(obj[key], visited)
-                        if payload is not None:
-                            return payload
-
-                for value in obj.values():
-                    payload = locate_payload(value, visited)
-                    if payload is not None:
-                        return payload
-                return None
+                    if status is not None or has_filled:
+                        return obj
 
-            if isinstance(obj, (list, tuple, set)):
-                for item in obj:
-                    payload = locate_payload(item, visited)
-                    if payload is not None:
-                        return payload
+                    children = [obj[key] for key in _NESTED_PAYLOAD_KEYS if key in obj]
+                    children.extend(obj.values())
+                    stack.extend(reversed(children))
+                elif isinstance(obj, (list, tuple, set)):
+                    stack.extend(reversed(list(obj)))
             return None
 
-        payload = locate_payload(raw, set())
+        payload = locate_payload(raw)
         if payload is None:
             raise RuntimeError(f"Unable to locate order status payload: {raw!r}")
 
@@ -731,59 +901,13 @@ class ClobPolymarketAPI(PolymarketAPI):
             except (TypeError, ValueError):
                 return None
 
-        primary_filled_keys = (
-            "filledAmount",
-            "filled",
-            "filledQuantity",
-            "filledSize",
-            "filledAmountQuote",
-            "filled_amount",
-            "totalFilled",
-            "matchedShares",
-            "shares",
-            "baseAmount",
-        )
-
         filled_amount: Optional[float] = None
-        for key in primary_filled_keys:
+        for key in _FILLED_KEYS:
             candidate = coerce_float(payload.get(key))
             if candidate is not None:
                 filled_amount = candidate
                 break
 
-        price_keys = (
-            "avgPrice",
-            "averagePrice",
-            "avg_price",
-            "filledAvgPrice",
-            "filledAveragePrice",
-            "executionPrice",
-            "averageExecutionPrice",
-            "fillPrice",
-            "matchedPrice",
-            "price",
-            "lastPrice",
-            "lastTradePrice",
-            "markPrice",
-        )
-
-        size_keys = (
-            "size",
-            "quantity",
-            "qty",
-            "amount",
-            "filledAmount",
-            "filled",
-            "filledQuantity",
-            "filledSize",
-            "matchedShares",
-            "shares",
-            "baseAmount",
-            "takingAmount",
-            "takerAmount",
-            "taker_amount",
-        )
-
         fills_payload = payload.get("fills")
         fills_sequence = fills_payload if isinstance(fills_payload, (list, tuple)) else None
 
@@ -795,7 +919,7 @@ class ClobPolymarketAPI(PolymarketAPI):
                 if not isinstance(entry, dict):
                     continue
                 size_val: Optional[float] = None
-                for key in size_keys:
+                for key in _FILL_SIZE_KEYS:
                     size_val = coerce_float(entry.get(key))
                     if size_val is not None and size_val > 0:
                         break
@@ -804,7 +928,7 @@ class ClobPolymarketAPI(PolymarketAPI):
                 total_from_fills += size_val
 
                 price_val: Optional[float] = None
-                for key in price_keys:
+                for key in _PRICE_KEYS:
                     price_val = coerce_float(entry.get(key))
                     if price_val is not None:
                         break
@@ -819,24 +943,10 @@ class ClobPolymarketAPI(PolymarketAPI):
 
         status_upper = str(status_value).upper()
 
-        if (filled_amount is None or filled_amount <= 1e-12) and status_upper in {
-            "FILLED",
-            "MATCHED",
-            "COMPLETED",
-            "EXECUTED",
-        }:
-            fallback_keys = (
-                "takingAmount",
-                "takerAmount",
-                "taker_amount",
-                "size",
-                "quantity",
-                "qty",
-                "matchedShares",
-                "shares",
-                "baseAmount",
-            )
-            for key in fallback_keys:
+        if (
+            filled_amount is None or filled_amount <= 1e-12
+        ) and status_upper in _FILLED_ORDER_STATUSES:
+            for key in _FALLBACK_FILLED_KEYS:
                 candidate = coerce_float(payload.get(key))
                 if candidate is not None:
                     filled_amount = candidate
@@ -848,7 +958,7 @@ class ClobPolymarketAPI(PolymarketAPI):
             )
 
         average_price: Optional[float] = None
-        for key in price_keys:
+        for key in _PRICE_KEYS:
             candidate = coerce_float(payload.get(key))
             if candidate is not None:
                 average_price = candidate